@@ -0,0 +1,316 @@
+"""Local HTTP/JSON scheduling API for batch integration (e.g. the university ERP)
+
+Run with `python api.py --port 8765`. The server binds to 127.0.0.1 by default
+and keeps every catalog warm in memory through one shared CatalogStore.
+
+Endpoints:
+    GET  /health
+    GET  /catalogs                    catalog years with program and course counts
+    GET  /catalogs/<catalog_year>     programs and semesters of one catalog
+    POST /reports                     batch timetable generation
+    POST /conflicts                   overlapping meetings within a program section
+    POST /calendars                   zip of .ics calendars per section and faculty member
+"""
+import json
+import argparse
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
+
+import pandas as pd
+
+import storage
+from calendar_export import default_term, stream_calendar_zip
+from catalog_store import CATALOG_FILES, CatalogStore, normalize_semester_name, get_semester_order
+from enrollment import normalize_enrollment, size_sections
+from reports import REPORT_COLUMNS, build_program_report, find_conflicts
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Largest request body accepted, in bytes
+MAX_BODY_BYTES = 50 * 1024 * 1024
+
+class ApiError(Exception):
+    """Error returned to the client as {"error": message} with an HTTP status"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+class SchedulingService:
+    """Catalog listing, report generation and conflict checking on top of a warm CatalogStore"""
+
+    def __init__(self, catalog_files=CATALOG_FILES, store=None):
+        self.catalog_files = catalog_files
+        self.store = store or CatalogStore()
+        self.store.ingest_all(catalog_files)
+        for catalog_year in catalog_files:
+            self.catalog(catalog_year)
+
+    def catalog(self, catalog_year):
+        if catalog_year not in self.catalog_files:
+            raise ApiError(404, f"Unknown catalog year: {catalog_year}")
+        return self.store.get(catalog_year, self.catalog_files[catalog_year])
+
+    def list_catalogs(self):
+        catalogs = []
+        for catalog_year in self.catalog_files:
+            catalog_df = self.catalog(catalog_year)
+            catalogs.append({
+                "catalog_year": catalog_year,
+                "programs": int(catalog_df["program"].nunique()),
+                "courses": len(catalog_df),
+            })
+        return {"catalogs": catalogs}
+
+    def describe_catalog(self, catalog_year):
+        catalog_df = self.catalog(catalog_year)
+        semester_order = get_semester_order()
+        semesters = sorted(
+            {normalize_semester_name(sem) for sem in catalog_df["semester"].unique()},
+            key=lambda sem: semester_order.index(sem) if sem in semester_order else 999
+        )
+        return {
+            "catalog_year": catalog_year,
+            "programs": sorted(catalog_df["program"].unique().tolist()),
+            "semesters": semesters,
+        }
+
+    def generate_reports(self, body):
+        """Generate timetables for every entry of body["requests"]
+
+        Top-level catalog_year, semester, capacity, students, include_weekend
+        and seed act as defaults for each request entry. An optional
+        body["enrollment"] list of (program, semester, course_code, active
+        students, failed/withdrawn students) records sizes courses individually.
+        Every non-empty timetable is saved to the schedule store once the whole
+        batch has been generated; its entry carries the stored report_id.
+        """
+        defaults = {
+            "capacity": 40,
+            "students": 1,
+            "include_weekend": True,
+            "seed": 0,
+            **{key: value for key, value in body.items() if key not in ("requests", "enrollment")},
+        }
+        requests = body.get("requests")
+        if not isinstance(requests, list) or not requests:
+            raise ApiError(400, "'requests' must be a non-empty list")
+
+        enrollment_df = None
+        if body.get("enrollment"):
+            try:
+                enrollment_df = normalize_enrollment(pd.DataFrame(body["enrollment"]))
+            except ValueError as e:
+                raise ApiError(400, f"Invalid enrollment: {e}")
+
+        reports, generated = [], []
+        for entry in requests:
+            if not isinstance(entry, dict):
+                raise ApiError(400, f"Each entry of 'requests' must be an object, got {entry!r}")
+            params = {**defaults, **entry}
+            for key in ("catalog_year", "semester", "program"):
+                if key not in params:
+                    raise ApiError(400, f"Missing '{key}' in request {entry}")
+
+            students = int_param(params, "students", minimum=1)
+            capacity = int_param(params, "capacity", minimum=1)
+            seed = int_param(params, "seed", minimum=0)
+            include_weekend = bool_param(params, "include_weekend")
+
+            catalog_df = self.catalog(params["catalog_year"])
+            if params["program"] not in set(catalog_df["program"]):
+                raise ApiError(404, f"Unknown program in catalog {params['catalog_year']}: {params['program']}")
+            semester = normalize_semester_name(params["semester"])
+            program_df = catalog_df[
+                (catalog_df["program"] == params["program"])
+                & (catalog_df["semester"].map(normalize_semester_name) == semester)
+            ][["program", "course_code", "course_title", "college"]]
+
+            rows = []
+            if not program_df.empty:
+                program_df = size_sections(
+                    program_df, students, capacity, enrollment_df, semester
+                )
+                report_df, _ = build_program_report(
+                    program_df, None, None, semester,
+                    params["catalog_year"], include_weekend, seed=seed
+                )
+                rows = to_records(report_df[REPORT_COLUMNS])
+                generated.append((len(reports), report_df))
+
+            reports.append({
+                "catalog_year": params["catalog_year"],
+                "program": params["program"],
+                "semester": semester,
+                "report_id": None,
+                "rows": rows,
+            })
+
+        for position, report_df in generated:
+            report = reports[position]
+            report["report_id"] = storage.save_report(
+                report_df, report["program"], report["semester"], report["catalog_year"]
+            )
+
+        return {"reports": reports, "row_count": sum(len(report["rows"]) for report in reports)}
+
+    def check_conflicts(self, body):
+        rows = body.get("rows")
+        if not isinstance(rows, list):
+            raise ApiError(400, "'rows' must be a list of timetable rows")
+        try:
+            conflicts = find_conflicts(rows)
+        except (KeyError, ValueError) as e:
+            raise ApiError(400, f"Invalid timetable row: {e}")
+        return {"count": len(conflicts), "conflicts": [{"a": a, "b": b} for a, b in conflicts]}
+
+    def calendar_archive(self, body):
+        """Generator of zip bytes for body["rows"] between body["term_start"] and body["term_end"]
+
+        Dates are ISO strings; the term defaults to TERM_WEEKS weeks from today.
+        """
+        rows = body.get("rows")
+        if not isinstance(rows, list) or not rows:
+            raise ApiError(400, "'rows' must be a non-empty list of timetable rows")
+        try:
+            term_start, term_end = default_term(
+                date.fromisoformat(body["term_start"]) if body.get("term_start") else None
+            )
+            if body.get("term_end"):
+                term_end = date.fromisoformat(body["term_end"])
+            archive = stream_calendar_zip(pd.DataFrame(rows), term_start, term_end)
+            # Produce the first chunk now so bad rows are reported as a 400
+            first_chunk = next(archive)
+        except (KeyError, ValueError) as e:
+            raise ApiError(400, f"Invalid calendar request: {e}")
+        return first_chunk, archive
+
+def int_param(params, key, minimum):
+    """params[key] as a whole number no smaller than `minimum`; raises a 400 ApiError otherwise"""
+    value = params[key]
+    try:
+        number = int(value)
+        if isinstance(value, bool) or number != float(value):
+            raise ValueError
+    except (TypeError, ValueError):
+        raise ApiError(400, f"'{key}' must be a whole number, got {value!r}")
+    if number < minimum:
+        raise ApiError(400, f"'{key}' must be at least {minimum}, got {number}")
+    return number
+
+def bool_param(params, key):
+    """params[key] as a JSON boolean; raises a 400 ApiError for anything else, such as the string 'false'"""
+    value = params[key]
+    if not isinstance(value, bool):
+        raise ApiError(400, f"'{key}' must be true or false, got {value!r}")
+    return value
+
+def to_records(df):
+    """JSON-ready list of row dicts"""
+    return json.loads(df.to_json(orient="records"))
+
+class SchedulingRequestHandler(BaseHTTPRequestHandler):
+    service = None
+
+    def do_GET(self):
+        path = unquote(urlparse(self.path).path).rstrip("/")
+        parts = path.split("/")[1:]
+
+        if path == "/health":
+            self.respond(lambda: {"status": "ok"})
+        elif path == "/catalogs":
+            self.respond(self.service.list_catalogs)
+        elif len(parts) == 2 and parts[0] == "catalogs":
+            self.respond(lambda: self.service.describe_catalog(parts[1]))
+        else:
+            self.send_json(404, {"error": f"Not found: {path}"})
+
+    def do_POST(self):
+        path = urlparse(self.path).path.rstrip("/")
+        if path == "/calendars":
+            self.respond_stream(lambda: self.service.calendar_archive(self.read_json()), "application/zip")
+            return
+        routes = {
+            "/reports": self.service.generate_reports,
+            "/conflicts": self.service.check_conflicts,
+        }
+        if path not in routes:
+            self.send_json(404, {"error": f"Not found: {path}"})
+            return
+        self.respond(lambda: routes[path](self.read_json()))
+
+    def read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            raise ApiError(413, "Request body too large")
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            raise ApiError(400, f"Invalid JSON: {e}")
+        if not isinstance(body, dict):
+            raise ApiError(400, "Request body must be a JSON object")
+        return body
+
+    def respond(self, handler):
+        try:
+            self.send_json(200, handler())
+        except ApiError as e:
+            self.send_json(e.status, {"error": str(e)})
+        except Exception as e:
+            self.send_json(500, {"error": f"{type(e).__name__}: {e}"})
+
+    def respond_stream(self, handler, content_type):
+        """Send (first chunk, remaining chunks) from `handler` without buffering the whole body"""
+        try:
+            first_chunk, chunks = handler()
+        except ApiError as e:
+            self.send_json(e.status, {"error": str(e)})
+            return
+        except Exception as e:
+            self.send_json(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+
+        # HTTP/1.0 responses end when the connection closes, so no Content-Length is needed
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(first_chunk)
+        for chunk in chunks:
+            self.wfile.write(chunk)
+
+    def send_json(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, service=None):
+    """Build a threaded server; port=0 picks a free port (see server.server_address)"""
+    handler = type("Handler", (SchedulingRequestHandler,), {"service": service or SchedulingService()})
+    return ThreadingHTTPServer((host, port), handler)
+
+def main():
+    parser = argparse.ArgumentParser(description="SSK ACMS local scheduling API")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port)
+    print(f"Serving SSK ACMS API on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Cold-start time to the login page
+
+Each run starts a fresh interpreter, renders app.py once as a logged-out
+session with Streamlit's AppTest and reports the wall time together with
+the heavy modules that were imported on the way.
+
+    python benchmarks/startup.py --runs 5
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+APP_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+HEAVY_MODULES = ["pandas", "numpy", "plotly.express", "scipy.sparse", "scheduler", "dashboard"]
+
+RUN_ONCE = """
+import sys, json, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=60)
+at.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "login_form": any(button.label.endswith("Login") for button in at.button),
+    "loaded": [name for name in {modules!r} if name in sys.modules],
+}}))
+"""
+
+def measure(runs):
+    results = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", RUN_ONCE.format(app=APP_FILE, modules=HEAVY_MODULES)],
+            capture_output=True, text=True, check=True, cwd=os.path.dirname(APP_FILE)
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start time to the SSK ACMS login page")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    results = measure(args.runs)
+    seconds = [result["seconds"] for result in results]
+    print(f"time to login page: median {statistics.median(seconds):.3f}s, "
+          f"min {min(seconds):.3f}s, max {max(seconds):.3f}s over {len(seconds)} runs")
+    print(f"login form rendered: {all(result['login_form'] for result in results)}")
+    print(f"heavy modules imported: {', '.join(results[-1]['loaded']) or 'none'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Recurring iCalendar events for generated timetables, streamed into a zip archive"""
+import re
+import zipfile
+from datetime import date, timedelta
+
+from scheduler import parse_slot
+
+TERM_WEEKS = 16
+
+# Placeholder faculty name used until instructors are assigned
+UNASSIGNED_FACULTY = "Faculty Member"
+
+ICS_DAYS = {
+    "Monday": "MO", "Tuesday": "TU", "Wednesday": "WE", "Thursday": "TH",
+    "Friday": "FR", "Saturday": "SA", "Sunday": "SU",
+}
+WEEKDAY_NUMBERS = {day: number for number, day in enumerate(ICS_DAYS)}
+
+def default_term(start=None):
+    """(term start, term end) covering TERM_WEEKS weeks from `start` (today by default)"""
+    start = start or date.today()
+    return start, start + timedelta(weeks=TERM_WEEKS, days=-1)
+
+def escape_text(value):
+    """Escape a TEXT property value (RFC 5545 section 3.3.11)"""
+    return (
+        str(value).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+    )
+
+def fold_line(line):
+    """Split a content line into 75-octet pieces joined by CRLF and a space"""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    pieces, start = [], 0
+    while start < len(encoded):
+        end = min(start + (75 if not pieces else 74), len(encoded))
+        # Never cut a multi-byte character in half
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:
+            end -= 1
+        pieces.append(encoded[start:end].decode("utf-8"))
+        start = end
+    return "\r\n ".join(pieces)
+
+def first_meeting(term_start, days):
+    """Earliest date on or after `term_start` that falls on one of `days`"""
+    return min(
+        term_start + timedelta(days=(WEEKDAY_NUMBERS[day] - term_start.weekday()) % 7)
+        for day in days
+    )
+
+def vevent_lines(row, term_start, term_end, stamp):
+    """VEVENT content lines for one timetable row meeting weekly from term start to term end"""
+    slot = parse_slot(row["days"], row["time's"])
+    first = first_meeting(term_start, slot.days)
+    if first > term_end:
+        return []
+
+    def at(minutes):
+        return f"{first:%Y%m%d}T{minutes // 60:02d}{minutes % 60:02d}00"
+
+    uid = re.sub(
+        r"[^A-Za-z0-9]+", "-",
+        f"{row['program']}-{row['section']}-{row['course_code']}-{row['course_title']}-{slot.day_label}-{slot.start}"
+    )
+    summary = f"{row['course_code']} {row['course_title']}".strip()
+    description = f"{row['program']} section {row['section']}"
+    if row.get("name") and row["name"] != UNASSIGNED_FACULTY:
+        description += f"\nInstructor: {row['name']}"
+
+    return [
+        "BEGIN:VEVENT",
+        f"UID:{uid.strip('-')}@ssk-acms",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART:{at(slot.start)}",
+        f"DTEND:{at(slot.end)}",
+        f"RRULE:FREQ=WEEKLY;BYDAY={','.join(ICS_DAYS[day] for day in slot.days)};UNTIL={term_end:%Y%m%d}T235959",
+        f"SUMMARY:{escape_text(summary)}",
+        f"DESCRIPTION:{escape_text(description)}",
+        "END:VEVENT",
+    ]
+
+def calendar_text(name, rows, term_start, term_end):
+    """One VCALENDAR document with an event per row; times are local (floating) campus time"""
+    stamp = f"{date.today():%Y%m%d}T000000Z"
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//SSK ACMS//Timetable//EN",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{escape_text(name)}",
+    ]
+    for row in rows:
+        lines.extend(vevent_lines(row, term_start, term_end, stamp))
+    lines.append("END:VCALENDAR")
+    return "".join(fold_line(line) + "\r\n" for line in lines)
+
+def safe_file_name(name):
+    return re.sub(r"[^A-Za-z0-9._ -]+", "_", str(name)).strip() or "calendar"
+
+def iter_calendars(report_df, term_start, term_end):
+    """(archive path, .ics text) per program section, then per assigned faculty member
+
+    Rows are grouped one calendar at a time, so only a single calendar's text
+    is held in memory.
+    """
+    columns = ["program", "section", "course_code", "course_title", "name", "days", "time's"]
+    report_df = report_df[[column for column in columns if column in report_df.columns]]
+
+    for (program, section), section_df in report_df.groupby(["program", "section"], sort=True):
+        name = f"{program} - Section {section}"
+        yield (
+            f"sections/{safe_file_name(program)}/section_{safe_file_name(section)}.ics",
+            calendar_text(name, section_df.to_dict("records"), term_start, term_end),
+        )
+
+    if "name" in report_df.columns:
+        faculty_df = report_df[report_df["name"].notna() & (report_df["name"] != UNASSIGNED_FACULTY)]
+        for faculty, rows_df in faculty_df.groupby("name", sort=True):
+            yield (
+                f"faculty/{safe_file_name(faculty)}.ics",
+                calendar_text(str(faculty), rows_df.to_dict("records"), term_start, term_end),
+            )
+
+class _ChunkBuffer:
+    """Write-only, unseekable sink that hands written bytes back to a generator"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+def stream_zip(files):
+    """Yield a zip archive of (path, text) pairs chunk by chunk as each file is compressed"""
+    buffer = _ChunkBuffer()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for path, text in files:
+            archive.writestr(path, text)
+            data = buffer.drain()
+            if data:
+                yield data
+    yield buffer.drain()
+
+def stream_calendar_zip(report_df, term_start, term_end):
+    """Zip of every section and faculty calendar for a timetable, as a generator of bytes"""
+    return stream_zip(iter_calendars(report_df, term_start, term_end))
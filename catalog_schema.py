@@ -0,0 +1,111 @@
+import os
+import re
+import csv
+from functools import lru_cache
+
+import pandas as pd
+
+from storage import file_version
+
+# Declarative catalog layout: canonical fields, their header aliases, dtype and default
+CATALOG_SCHEMA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog_schema.csv")
+# Program name pattern -> college, used when a catalog has no college for a row
+COLLEGE_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "college_rules.csv")
+
+UNKNOWN_COLLEGE = "Unknown College"
+
+def normalize_header(name):
+    """Compare headers case-, spacing- and separator-insensitively: 'Course Code' == 'course_code'"""
+    return re.sub(r"[\s_\-]+", " ", str(name)).strip().lower()
+
+# Cached readers take the file's version (storage.file_version()) so an edited file is read again
+@lru_cache(maxsize=16)
+def load_catalog_schema(path, version):
+    """Read the schema into a tuple of (field, header aliases, dtype, default, required)"""
+    with open(path, newline="", encoding="utf-8") as f:
+        return tuple(
+            (
+                row["field"].strip(),
+                tuple(normalize_header(alias) for alias in row["aliases"].split("|")),
+                row["dtype"].strip(),
+                row["default"],
+                row["required"].strip().lower() == "true",
+            )
+            for row in csv.DictReader(f)
+        )
+
+@lru_cache(maxsize=16)
+def load_college_rules(path, version):
+    """Read (college, compiled pattern) rules; first match wins"""
+    with open(path, newline="", encoding="utf-8") as f:
+        return tuple(
+            (row["college"].strip(), re.compile(row["pattern"], re.IGNORECASE))
+            for row in csv.DictReader(f)
+        )
+
+@lru_cache(maxsize=256)
+def detect_layout(headers, schema_path, schema_version):
+    """{field: column position} for a header tuple, cached so every file with this layout reuses it
+
+    The first matching header wins, so duplicated headers (e.g. two
+    'Catalog Code' columns) are harmless. Raises ValueError naming missing
+    required fields.
+    """
+    normalized = [normalize_header(header) for header in headers]
+    positions = {}
+    missing = []
+    for field, aliases, _, _, required in load_catalog_schema(schema_path, schema_version):
+        position = next((i for i, header in enumerate(normalized) if header in aliases), None)
+        if position is not None:
+            positions[field] = position
+        elif required:
+            missing.append(field)
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+    return positions
+
+@lru_cache(maxsize=1024)
+def college_for_program(program_name, rules_version):
+    """College from the first college rule matching the program name"""
+    for college, pattern in load_college_rules(COLLEGE_RULES_FILE, rules_version):
+        if pattern.search(program_name):
+            return college
+    return UNKNOWN_COLLEGE
+
+def clean_text(values, default):
+    """Stripped strings with blanks and NaN replaced by `default` (None keeps them missing)"""
+    text = values.astype("string").str.strip()
+    text = text.mask(text == "")
+    return text.fillna(default) if default is not None else text
+
+def normalize_catalog(raw_df, schema_path=CATALOG_SCHEMA_FILE):
+    """Map any supported catalog layout onto the canonical schema columns in one pass
+
+    Columns are picked by alias, converted by dtype and defaulted; a missing
+    or blank college is derived from the program name. Rows without a
+    semester are dropped. Raises ValueError when a required field is missing.
+    """
+    schema_version = file_version(schema_path)
+    layout = detect_layout(tuple(raw_df.columns), schema_path, schema_version)
+    columns = {}
+    for field, _, dtype, default, _ in load_catalog_schema(schema_path, schema_version):
+        if field in layout:
+            values = raw_df.iloc[:, layout[field]]
+        else:
+            values = pd.Series(pd.NA, index=raw_df.index, dtype="string")
+        if dtype == "semester":
+            columns[field] = clean_text(values, None).str.lower()
+        elif dtype == "code":
+            columns[field] = clean_text(values, "")
+        else:
+            columns[field] = clean_text(values, default or None)
+
+    catalog_df = pd.DataFrame(columns)
+    catalog_df = catalog_df[catalog_df["semester"].notna()]
+
+    programs = catalog_df["program"].fillna("")
+    rules_version = file_version(COLLEGE_RULES_FILE)
+    derived = programs.map({program: college_for_program(program, rules_version) for program in programs.unique()})
+    catalog_df["college"] = catalog_df["college"].fillna(derived)
+
+    return catalog_df.reset_index(drop=True)
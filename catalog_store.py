@@ -0,0 +1,116 @@
+import threading
+
+import pandas as pd
+
+import storage
+from catalog_schema import CATALOG_SCHEMA_FILE, COLLEGE_RULES_FILE, normalize_catalog
+from storage import file_version
+
+# Views handed to sessions rely on copy-on-write so edits never reach the shared frame.
+# It is always on from pandas 3.0, where setting the option is deprecated.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# Available catalog files
+CATALOG_FILES = {
+    "2020-2021": "2020-21.csv",
+    "2021-2022": "2021-22.csv",
+    "2022-2023": "2022-23.csv",
+    "2023-2024": "2023-24.csv",
+    "2024-2025": "2024-2025.csv",
+    "2025-2026": "csvcatalog 2025-26 timetables.csv"
+}
+
+ENCODINGS_TO_TRY = ['utf-8', 'latin-1', 'windows-1252', 'iso-8859-1', 'cp1252']
+
+def normalize_semester_name(semester):
+    """Normalize semester names for consistent ordering"""
+    semester_str = str(semester).lower().strip()
+
+    if semester_str in ['one', '1', 'first', 'semester 1', 'sem 1']:
+        return 'one'
+    elif semester_str in ['two', '2', 'second', 'semester 2', 'sem 2']:
+        return 'two'
+    elif semester_str in ['three', '3', 'third', 'semester 3', 'sem 3']:
+        return 'three'
+    elif semester_str in ['four', '4', 'fourth', 'semester 4', 'sem 4']:
+        return 'four'
+    elif semester_str in ['five', '5', 'fifth', 'semester 5', 'sem 5']:
+        return 'five'
+    elif semester_str in ['six', '6', 'sixth', 'semester 6', 'sem 6']:
+        return 'six'
+    elif semester_str in ['seven', '7', 'seventh', 'semester 7', 'sem 7']:
+        return 'seven'
+    elif semester_str in ['eight', '8', 'eighth', 'eights', 'semester 8', 'sem 8']:
+        return 'eight'
+    else:
+        return semester_str
+
+def get_semester_order():
+    """Return the proper order for semesters"""
+    return ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight']
+
+def catalog_version(filename):
+    """Version of a catalog file together with the schema files that shape its normalized form"""
+    versions = [file_version(path) for path in (filename, CATALOG_SCHEMA_FILE, COLLEGE_RULES_FILE)]
+    return max(mtime_ns for mtime_ns, _ in versions), sum(size for _, size in versions)
+
+def read_catalog_file(filename):
+    """Read a catalog CSV and normalize it to the catalog schema; raises if the file cannot be read"""
+    for encoding in ENCODINGS_TO_TRY:
+        try:
+            catalog_df = pd.read_csv(filename, encoding=encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+        except Exception:
+            if encoding == ENCODINGS_TO_TRY[-1]:
+                raise
+            continue
+    else:
+        raise ValueError(f"Could not decode {filename} with any of the attempted encodings")
+
+    return normalize_catalog(catalog_df)
+
+class CatalogStore:
+    """One read-only catalog DataFrame per file version, shared by every session in the process
+
+    Catalogs are served from the SQLite store; get() syncs the CSV into it
+    when the file is new or has changed, then returns a shallow view of the
+    shared frame. A newer version of the file on disk replaces the cached one
+    on the next get().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._catalogs = {}
+
+    def get(self, catalog_year, filename):
+        version = catalog_version(filename)
+        with self._lock:
+            cached = self._catalogs.get(catalog_year)
+            if cached is None or cached[0] != version:
+                storage.sync_catalog(catalog_year, filename, version, read_catalog_file)
+                cached = (version, storage.load_catalog(catalog_year))
+                self._catalogs[catalog_year] = cached
+        return cached[1].copy(deep=False)
+
+    def ingest_all(self, catalog_files):
+        """Bring the SQLite store up to date with every catalog file without caching frames"""
+        return storage.ingest_catalogs(catalog_files, read_catalog_file, version=catalog_version)
+
+    def invalidate(self, catalog_year=None):
+        """Drop one catalog, or every catalog when no year is given"""
+        with self._lock:
+            if catalog_year is None:
+                self._catalogs.clear()
+            else:
+                self._catalogs.pop(catalog_year, None)
+
+    def memory_usage(self):
+        """Bytes held per cached catalog year"""
+        with self._lock:
+            return {
+                catalog_year: int(catalog_df.memory_usage(deep=True).sum())
+                for catalog_year, (_, catalog_df) in self._catalogs.items()
+            }
@@ -0,0 +1,795 @@
+import pandas as pd
+import streamlit as st
+from io import BytesIO
+import storage
+from calendar_export import default_term, stream_calendar_zip
+from catalog_schema import normalize_catalog
+from catalog_store import CATALOG_FILES, CatalogStore, normalize_semester_name, get_semester_order
+from enrollment import create_enrollment_template, normalize_enrollment, size_sections
+from login import USERS
+from scheduler import program_type_for
+from theme import get_base64_of_bin_file, set_background_image
+
+def create_upload_template():
+    """Create a template CSV file for upload"""
+    template_data = {
+        'program': ['BBA', 'BBA', 'MBA', 'BCS'],
+        'college': ['College of Business Management', 'College of Business Management', 'College of Business Management', 'College of Computer Science'],
+        'semester': ['one', 'one', 'one', 'two'],
+        'course_code': ['ACC101', 'MGT101', 'MBA501', 'CS201'],
+        'course_title': ['Introduction to Accounting', 'Principles of Management', 'Strategic Management', 'Data Structures']
+    }
+    
+    template_df = pd.DataFrame(template_data)
+    return template_df
+
+def show_upload_guidelines():
+    """Display upload guidelines and template"""
+    st.markdown("""
+    <h3 style='color: white !important; text-shadow: 2px 2px 4px rgba(0,0,0,0.8);'>📋 Upload Guidelines</h3>
+    
+    <h4 style='color: white !important; text-shadow: 2px 2px 4px rgba(0,0,0,0.8);'>Required Columns:</h4>
+    <ul style='color: white !important; text-shadow: 2px 2px 4px rgba(0,0,0,0.8);'>
+        <li><strong>program</strong> - Name of the academic program (e.g., BBA, MBA, BCS)</li>
+        <li><strong>college</strong> - Name of the college offering the course (optional; derived from the program name when missing)</li>
+        <li><strong>semester</strong> - Semester number (one, two, three, etc. or 1, 2, 3, etc.)</li>
+        <li><strong>course_code</strong> - Unique course identifier (e.g., ACC101, MGT201)</li>
+        <li><strong>course_title</strong> - Full name of the course</li>
+    </ul>
+    
+    <h4 style='color: white !important; text-shadow: 2px 2px 4px rgba(0,0,0,0.8);'>Important Notes:</h4>
+    <ul style='color: white !important; text-shadow: 2px 2px 4px rgba(0,0,0,0.8);'>
+        <li>✅ All columns listed above except college are <strong>REQUIRED</strong></li>
+        <li>✅ Column names are case-insensitive; common variants such as <strong>Course Code</strong> or <strong>Title</strong> are recognized</li>
+        <li>✅ Semester values can be: <strong>one/1, two/2, three/3, four/4, five/5, six/6, seven/7, eight/8</strong></li>
+        <li>✅ File format: <strong>CSV (.csv) or Excel (.xlsx)</strong></li>
+        <li>✅ Make sure there are <strong>no empty rows</strong> in your data</li>
+        <li>✅ Course codes should be <strong>unique within each program and semester</strong></li>
+    </ul>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Show template preview as table
+    st.markdown("<h4 style='color: white !important; text-shadow: 2px 2px 4px rgba(0,0,0,0.8);'>📄 Template Preview:</h4>", unsafe_allow_html=True)
+    
+    template_df = create_upload_template()
+    st.dataframe(template_df, use_container_width=True, hide_index=True)
+    
+    # Download template button
+    csv_template = template_df.to_csv(index=False).encode('utf-8')
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.download_button(
+            label="📥 Download Template CSV",
+            data=csv_template,
+            file_name="ssk_acms_upload_template.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+
+def generate_report_summary(final_df, program_filter, semester_filter, student_counts=None, section_capacities=None):
+    """Generate a comprehensive summary of the generated report"""
+    
+    # Program-wise breakdown at the end
+    if program_filter == "All Programs":
+        st.markdown("---")
+        st.markdown("""
+        <div style='background: rgba(255,255,255,0.95); padding: 20px; border-radius: 10px; margin-top: 15px;'>
+            <h4 style='color: #1a1a1a; margin-top: 0;'>📚 Program-wise Breakdown</h4>
+        """, unsafe_allow_html=True)
+        
+        program_summary = final_df.groupby('program').agg({
+            'course_code': 'count',
+            'section': 'nunique',
+            'total student strength': 'max'
+        }).reset_index()
+        program_summary.columns = ['Program', 'Courses', 'Sections', 'Students']
+        
+        # Add capacity information if available
+        if section_capacities:
+            capacity_list = []
+            for prog in program_summary['Program']:
+                capacity = section_capacities.get(prog, 40)
+                capacity_list.append(capacity)
+            program_summary['Section Capacity'] = capacity_list
+        
+        st.dataframe(program_summary, use_container_width=True, hide_index=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False)
+def load_roster(file_name, file_bytes):
+    """Co-enrollment counts and conflict edges for an uploaded roster file"""
+    from rosters import co_enrollment, conflict_edges, normalize_roster
+
+    co = co_enrollment(normalize_roster(read_uploaded_file(file_name, file_bytes)))
+    return co, conflict_edges(co)
+
+@st.cache_resource
+def get_catalog_store():
+    """Process-wide catalog store shared by all sessions"""
+    store = CatalogStore()
+    store.ingest_all(CATALOG_FILES)
+    return store
+
+@st.cache_data(show_spinner=False)
+def read_uploaded_file(file_name, file_bytes):
+    """Parse an uploaded catalog once per distinct file content"""
+    if file_name.endswith(".csv"):
+        return pd.read_csv(BytesIO(file_bytes))
+    return pd.read_excel(BytesIO(file_bytes))
+
+def load_catalog_data(catalog_year):
+    """Load catalog data from the repository CSV file"""
+    filename = CATALOG_FILES[catalog_year]
+    
+    try:
+        return get_catalog_store().get(catalog_year, filename), True
+    except Exception as e:
+        st.error(f"Error loading catalog file {filename}: {e}")
+        return None, False
+
+@st.cache_data(show_spinner=False)
+def summarize_colleges(catalog_df):
+    """Programs per college and the pie chart hover text for the insights panel"""
+    college_program_counts = catalog_df.groupby('college')['program'].nunique().reset_index()
+    college_program_counts.columns = ['college', 'program_count']
+    college_program_counts = college_program_counts.sort_values('program_count', ascending=False)
+    
+    hover_text = []
+    for college in college_program_counts['college']:
+        programs_in_college = catalog_df[catalog_df['college'] == college]['program'].unique()
+        programs_list = "<br>• ".join(sorted(programs_in_college))
+        hover_text.append(f"<b>{college}</b><br>Programs: {len(programs_in_college)}<br><br>• {programs_list}")
+    
+    totals = (
+        catalog_df['college'].nunique(),
+        catalog_df['program'].nunique(),
+        len(catalog_df)
+    )
+    return college_program_counts, hover_text, totals
+
+def create_catalog_charts(catalog_df, selected_catalog_year):
+    """Create single pie chart showing college distribution by number of programs"""
+    import plotly.express as px
+    
+    st.markdown(f"""
+    <div style='text-align: center; margin-bottom: 20px;'>
+        <h2 style='color: white !important; text-shadow: 3px 3px 6px rgba(0,0,0,0.8) !important; 
+                   font-weight: bold !important; margin: 0 !important; font-size: 2.2rem !important;
+                   font-family: Arial Black, sans-serif !important;'>
+            📊 Catalog Insights - {selected_catalog_year}
+        </h2>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    college_program_counts, hover_text, (total_colleges, total_programs, total_courses) = summarize_colleges(catalog_df)
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        fig_college = px.pie(
+            values=college_program_counts['program_count'],
+            names=college_program_counts['college'],
+            color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD', '#98D8C8']
+        )
+        
+        fig_college.update_traces(
+            hovertemplate=hover_text,
+            textinfo="label+percent",
+            textfont_size=14,
+            textfont_color='white',
+            textposition='inside'
+        )
+        
+        fig_college.update_layout(
+            height=300,
+            showlegend=True,
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='#1a1a1a', size=14, family="Arial Black"),
+            legend=dict(
+                orientation="v",
+                yanchor="middle",
+                y=0.5,
+                xanchor="left",
+                x=1.05,
+                font=dict(size=12, color='#1a1a1a'),
+                bgcolor='rgba(255,255,255,0.9)',
+                bordercolor='#1a1a1a',
+                borderwidth=1
+            ),
+            margin=dict(l=20, r=150, t=5, b=5)
+        )
+        
+        st.plotly_chart(fig_college, use_container_width=True)
+    
+    st.markdown("---")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div style='background: rgba(255,255,255,0.7); padding: 15px; border-radius: 10px; border: 1px solid rgba(255,255,255,0.5); text-align: center; backdrop-filter: blur(5px);'>
+            <h3 style='color: #1a1a1a; margin: 0; text-shadow: 1px 1px 2px rgba(255,255,255,0.8);'>Total Colleges</h3>
+            <h1 style='color: #FF6B6B; margin: 10px 0 0 0; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);'>{}</h1>
+        </div>
+        """.format(total_colleges), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div style='background: rgba(255,255,255,0.7); padding: 15px; border-radius: 10px; border: 1px solid rgba(255,255,255,0.5); text-align: center; backdrop-filter: blur(5px);'>
+            <h3 style='color: #1a1a1a; margin: 0; text-shadow: 1px 1px 2px rgba(255,255,255,0.8);'>Total Programs</h3>
+            <h1 style='color: #4ECDC4; margin: 10px 0 0 0; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);'>{}</h1>
+        </div>
+        """.format(total_programs), unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div style='background: rgba(255,255,255,0.7); padding: 15px; border-radius: 10px; border: 1px solid rgba(255,255,255,0.5); text-align: center; backdrop-filter: blur(5px);'>
+            <h3 style='color: #1a1a1a; margin: 0; text-shadow: 1px 1px 2px rgba(255,255,255,0.8);'>Total Courses</h3>
+            <h1 style='color: #45B7D1; margin: 10px 0 0 0; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);'>{}</h1>
+        </div>
+        """.format(total_courses), unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False)
+def get_semester_display_list(raw_semesters):
+    """Catalog semester values sorted by their normalized order"""
+    normalized_semesters = []
+    
+    for sem in raw_semesters:
+        if sem and str(sem).strip():
+            normalized = normalize_semester_name(sem)
+            normalized_semesters.append((normalized, sem))
+    
+    semester_order = get_semester_order()
+    normalized_semesters.sort(key=lambda x: semester_order.index(x[0]) if x[0] in semester_order else 999)
+    
+    return [original for normalized, original in normalized_semesters]
+
+@st.fragment
+def program_settings_fragment(programs_list):
+    """Per-program student and capacity inputs; editing them reruns only this fragment"""
+    with st.expander("👥 Program Settings", expanded=False):
+        st.markdown("**Configure each program:**")
+        for program in programs_list:
+            st.markdown(f"**{program}**")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.session_state.student_counts[program] = st.number_input(
+                    "Students",
+                    min_value=0,
+                    value=st.session_state.student_counts.get(program, 1),
+                    step=1,
+                    key=f"students_{program}",
+                    help="Set to 0 to exclude this program"
+                )
+            with col2:
+                st.session_state.section_capacities[program] = st.number_input(
+                    "Capacity",
+                    min_value=1,
+                    max_value=100,
+                    value=st.session_state.section_capacities.get(program, 40),
+                    step=1,
+                    key=f"capacity_{program}",
+                    help="Students per section"
+                )
+            st.markdown("---")
+
+@st.fragment
+def report_results_fragment(final_df, program_filter, semester_filter, catalog_name, student_counts=None, section_capacities=None, clashes_df=None, diagnostics=None):
+    """Render a generated report; downloading reruns only this fragment so the report stays on screen"""
+    # Generate summary
+    generate_report_summary(final_df, program_filter, semester_filter, student_counts, section_capacities)
+    
+    if diagnostics is not None:
+        render_diagnostics(*diagnostics)
+    
+    if clashes_df is not None:
+        if clashes_df.empty:
+            st.success("✅ No student clashes: every co-enrolled course pair has a clash-free section combination")
+        else:
+            st.warning(
+                f"⚠️ {int(clashes_df['shared students'].sum())} student clashes across "
+                f"{len(clashes_df)} course pairs with no clash-free section combination"
+            )
+            st.dataframe(clashes_df, use_container_width=True, hide_index=True)
+    
+    if program_filter == "All Programs":
+        # Display program-wise data
+        for program in final_df["program"].unique():
+            st.subheader(f"📚 {program}")
+            st.dataframe(final_df[final_df["program"] == program])
+        
+        label = "📥 Download Complete Schedule CSV"
+        file_name = f"timetable_AllPrograms_{semester_filter}_{catalog_name}.csv"
+    else:
+        st.dataframe(final_df)
+        
+        label = "📥 Download CSV"
+        file_name = f"timetable_{program_filter}_{semester_filter}_{catalog_name}.csv"
+    
+    csv = final_df.to_csv(index=False).encode('utf-8')
+    st.download_button(
+        label=label,
+        data=csv,
+        file_name=file_name,
+        mime="text/csv",
+    )
+    
+    # Calendar export: one recurring-event .ics per program section and assigned faculty member
+    col1, col2 = st.columns(2)
+    with col1:
+        term_start = st.date_input("Term Start", value=default_term()[0])
+    with col2:
+        # The default end follows the chosen start, so it never falls below min_value
+        term_end = st.date_input("Term End", value=default_term(term_start)[1], min_value=term_start)
+    # The zip is built only on request, once per report and term
+    if st.button("📅 Prepare Calendars (.ics)"):
+        st.session_state.calendar_term = (term_start, term_end)
+    if st.session_state.get("calendar_term") == (term_start, term_end):
+        st.download_button(
+            label="📥 Download Calendars (.ics)",
+            data=build_calendar_zip(final_df, term_start, term_end),
+            file_name=file_name.rsplit(".", 1)[0] + "_calendars.zip",
+            mime="application/zip",
+        )
+
+def flag_infeasible(feasibility_df):
+    """Warn before scheduling when a program cannot fit its courses into its time grid"""
+    infeasible = feasibility_df[~feasibility_df["feasible"]]
+    if not infeasible.empty:
+        st.error(
+            f"⚠️ {len(infeasible)} program(s) cannot be scheduled without clashes: "
+            f"{', '.join(infeasible['program'])}. See Scheduler Diagnostics below."
+        )
+
+def render_diagnostics(feasibility_df, fallbacks_df, utilization):
+    """Feasibility bounds, fallback placements and a slot utilization heatmap"""
+    import plotly.graph_objects as go
+    
+    title = "🔍 Scheduler Diagnostics"
+    if not fallbacks_df.empty:
+        title += f" – {int(fallbacks_df['fallback sections'].sum())} fallback placements"
+    with st.expander(title, expanded=not fallbacks_df.empty):
+        st.markdown("**Feasibility (courses per section vs. non-overlapping slots)**")
+        st.dataframe(feasibility_df, use_container_width=True, hide_index=True)
+        
+        if fallbacks_df.empty:
+            st.success("✅ Every section was placed in a free slot")
+        else:
+            st.markdown("**Fallback placements per course** (no free slot; placed at random and may clash)")
+            st.dataframe(fallbacks_df, use_container_width=True, hide_index=True)
+        
+        fig = go.Figure(go.Heatmap(
+            z=utilization.counts,
+            x=utilization.slots,
+            y=utilization.programs,
+            colorscale="YlOrRd",
+            colorbar=dict(title="Sections"),
+            hovertemplate="%{y}<br>%{x}<br>%{z} sections<extra></extra>"
+        ))
+        fig.update_layout(
+            height=max(300, 22 * len(utilization.programs) + 150),
+            margin=dict(l=20, r=20, t=10, b=10),
+            xaxis=dict(tickangle=-45)
+        )
+        st.markdown("**Slot utilization (sections per program and time slot)**")
+        st.plotly_chart(fig, use_container_width=True)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def build_calendar_zip(final_df, term_start, term_end):
+    """Zipped section and faculty calendars for a report, cached per report and term"""
+    return b"".join(stream_calendar_zip(final_df, term_start, term_end))
+
+@st.cache_data(show_spinner=False)
+def run_scenario_sweep(sized_df, capacities):
+    """Scenario table for one semester's sized courses, cached per input"""
+    from scenarios import sweep_scenarios
+
+    return sweep_scenarios(sized_df, capacities)
+
+@st.fragment
+def scenario_sweep_fragment(courses_df, enrollment_df, semester):
+    """Compare section capacities and weekend policies for all programs in one run
+
+    Courses are sized from the current Program Settings in session state on
+    every run, since the settings fragment can change them without a full rerun.
+    """
+    import plotly.express as px
+    from scenarios import SWEEP_CAPACITIES
+    
+    with st.expander("📊 Capacity Scenarios", expanded=False):
+        low, high = st.slider("Section Capacity Range", min_value=10, max_value=100,
+                              value=(SWEEP_CAPACITIES[0], SWEEP_CAPACITIES[-1]))
+        step = st.number_input("Capacity Step", min_value=1, max_value=20, value=5, step=1)
+        if st.button("Run Scenarios"):
+            student_counts = st.session_state.student_counts
+            courses_df = courses_df[courses_df["program"].map(lambda p: student_counts.get(p, 1) != 0)]
+            sized_df = size_sections(
+                courses_df, student_counts, st.session_state.section_capacities, enrollment_df, semester
+            )
+            with st.spinner("Scheduling every scenario..."):
+                scenarios_df = run_scenario_sweep(sized_df, tuple(range(low, high + 1, step)))
+            scenarios_df["weekend courses"] = scenarios_df["weekend courses"].map({True: "Included", False: "Excluded"})
+
+            fig = px.line(
+                scenarios_df.melt(
+                    id_vars=["section capacity", "weekend courses"],
+                    value_vars=["sections", "peak rooms", "fallback conflicts"],
+                    var_name="metric"
+                ),
+                x="section capacity", y="value", color="metric", line_dash="weekend courses", markers=True
+            )
+            fig.update_layout(height=350, margin=dict(l=20, r=20, t=10, b=10))
+            st.plotly_chart(fig, use_container_width=True)
+            st.dataframe(scenarios_df, use_container_width=True, hide_index=True)
+
+@st.fragment
+def schedule_history_fragment():
+    """Look up stored timetables by course or by day and time slot"""
+    with st.expander("🗄️ Schedule History", expanded=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            course_code = st.text_input("Course Code", placeholder="e.g. COM107")
+            if course_code:
+                st.dataframe(storage.course_sections(course_code), use_container_width=True, hide_index=True)
+        with col2:
+            day = st.selectbox("Day", ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"])
+            start_time = st.text_input("Slot Start", placeholder="e.g. 9:00")
+            if start_time:
+                st.dataframe(storage.slot_load(day, start_time.strip()), use_container_width=True, hide_index=True)
+
+def main_app():
+    """Main application interface"""
+    set_background_image()
+    
+    # Header
+    st.markdown("""
+    <div style='display: flex; align-items: center; justify-content: space-between; padding: 3px 0; margin-bottom: 5px; background: rgba(255,255,255,0.15); border-radius: 15px; backdrop-filter: blur(20px); border: 1px solid rgba(255,255,255,0.2);'>
+        <div style='display: flex; align-items: center; gap: 10px; flex: 1;'>
+            <div style='margin-left: 8px;'>
+    """, unsafe_allow_html=True)
+    
+    try:
+        bin_str = get_base64_of_bin_file('iobm.png')
+        if bin_str:
+            st.markdown(f'<img src="data:image/png;base64,{bin_str}" width="45" style="border-radius: 10px; box-shadow: 0 4px 15px rgba(0,0,0,0.3);">', unsafe_allow_html=True)
+        else:
+            st.markdown('<div style="width: 45px; height: 30px; background: rgba(255,255,255,0.3); display: flex; align-items: center; justify-content: center; border-radius: 10px; color: white; font-weight: bold; font-size: 10px;">IOBM</div>', unsafe_allow_html=True)
+    except:
+        st.markdown('<div style="width: 45px; height: 30px; background: rgba(255,255,255,0.3); display: flex; align-items: center; justify-content: center; border-radius: 10px; color: white; font-weight: bold; font-size: 10px;">IOBM</div>', unsafe_allow_html=True)
+    
+    st.markdown(f"""
+            </div>
+            <div>
+                <h1 style='color: white !important; font-size: 1.8rem; margin: 0; text-shadow: 3px 3px 6px rgba(0,0,0,0.8) !important; font-family: Arial Black !important; font-weight: bold !important;'>SSK ACMS</h1>
+            </div>
+        </div>
+        <div style='text-align: right; margin-right: 10px;'>
+            <p style='color: white !important; font-size: 12px; font-weight: bold !important; text-shadow: 2px 2px 4px rgba(0,0,0,0.8) !important; margin: 0;'>
+                Welcome, {USERS[st.session_state.username]['display_name']}!
+            </p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Logout button
+    st.sidebar.markdown("---")
+    if st.sidebar.button("🚪 Logout", use_container_width=True, type="secondary"):
+        keys_to_delete = list(st.session_state.keys())
+        for key in keys_to_delete:
+            del st.session_state[key]
+        st.session_state.logged_in = False
+        st.session_state.username = ""
+        st.rerun()
+    
+    # Sidebar
+    st.sidebar.header("Input Parameters")
+
+    data_source = st.sidebar.radio(
+        "Choose Data Source:",
+        ["📊 Institutional Catalog", "📁 Upload Your Own File"],
+        index=0
+    )
+    
+    catalog_df = None
+    selected_catalog_year = None
+    
+    if data_source == "📊 Institutional Catalog":
+        default_index = list(CATALOG_FILES.keys()).index("2023-2024")
+        selected_catalog_year = st.sidebar.selectbox(
+            "Select Academic Year:",
+            list(CATALOG_FILES.keys()),
+            index=default_index
+        )
+        
+        catalog_df, success = load_catalog_data(selected_catalog_year)
+        if not success:
+            st.error(f"Failed to load the {selected_catalog_year} catalog.")
+            st.stop()
+        
+        catalog_memory = get_catalog_store().memory_usage()
+        st.sidebar.caption(
+            f"Shared catalog cache: {len(catalog_memory)} catalog(s), "
+            f"{sum(catalog_memory.values()) / 1024 ** 2:.1f} MB"
+        )
+        
+        create_catalog_charts(catalog_df, selected_catalog_year)
+            
+    else:
+        # Show upload guidelines first
+        show_upload_guidelines()
+        
+        uploaded_file = st.sidebar.file_uploader("Upload Catalog File", type=["csv", "xlsx"])
+        if uploaded_file:
+            try:
+                try:
+                    catalog_df = normalize_catalog(read_uploaded_file(uploaded_file.name, uploaded_file.getvalue()))
+                except ValueError as e:
+                    st.error(f"❌ {e}")
+                    st.info("Please download the template and ensure all required columns are present.")
+                    st.stop()
+                
+                selected_catalog_year = "Custom Upload"
+                st.success("✅ File uploaded successfully!")
+                create_catalog_charts(catalog_df, selected_catalog_year)
+                
+            except Exception as e:
+                st.error(f"Error reading file: {e}")
+                st.stop()
+        else:
+            st.warning("Please upload a file to continue.")
+            st.stop()
+
+    if catalog_df is None:
+        st.error("No data loaded.")
+        st.stop()
+
+    # Program selection
+    programs_list = sorted(catalog_df["program"].unique())
+    programs_with_all = ["All Programs"] + programs_list
+    program_filter = st.sidebar.selectbox("Select Program", programs_with_all)
+    
+    # Semester selection
+    semester_display_list = get_semester_display_list(tuple(catalog_df["semester"].unique()))
+    semester_filter = st.sidebar.selectbox("Select Semester", semester_display_list)
+    
+    selected_programs = [program_filter] if program_filter != "All Programs" else programs_list
+    has_bachelor_programs = any(program_type_for(prog)[1] for prog in selected_programs)
+    
+    include_weekend_courses = True
+    if has_bachelor_programs:
+        st.sidebar.markdown("### Weekend Course Settings")
+        include_weekend_courses = st.sidebar.checkbox(
+            "Include Weekend Courses",
+            value=True,
+            help="Uncheck to avoid weekend classes"
+        )
+    
+    st.sidebar.markdown("### Timetable Optimization")
+    optimize_timetable = st.sidebar.checkbox(
+        "Optimize Timetable Quality",
+        value=False,
+        help="Reduce idle gaps, weekend and late-evening classes after the initial schedule is built"
+    )
+    optimization_seconds = 0.0
+    if optimize_timetable:
+        optimization_seconds = st.sidebar.number_input(
+            "Optimization Time per Program (seconds)",
+            min_value=0.5,
+            max_value=30.0,
+            value=2.0,
+            step=0.5
+        )
+    
+    # Per-course enrollment upload
+    st.sidebar.markdown("### Enrollment Data")
+    enrollment_file = st.sidebar.file_uploader(
+        "Upload Enrollment Table (optional)",
+        type=["csv", "xlsx"],
+        help="Columns: program, semester, course_code, active students, failed/withdrawn students. "
+             "Courses not listed use the student counts below."
+    )
+    enrollment_df = None
+    if enrollment_file:
+        try:
+            enrollment_df = normalize_enrollment(read_uploaded_file(enrollment_file.name, enrollment_file.getvalue()))
+            st.sidebar.success(f"✅ Enrollment loaded for {len(enrollment_df)} courses")
+        except Exception as e:
+            st.sidebar.error(f"Error reading enrollment file: {e}")
+    st.sidebar.download_button(
+        label="📥 Download Enrollment Template",
+        data=create_enrollment_template().to_csv(index=False).encode('utf-8'),
+        file_name="ssk_acms_enrollment_template.csv",
+        mime="text/csv",
+        use_container_width=True
+    )
+    
+    roster_file = st.sidebar.file_uploader(
+        "Upload Student Rosters (optional)",
+        type=["csv", "xlsx"],
+        help="Columns: student_id, course_code. Courses that share students are kept apart "
+             "and student clashes are counted in the report."
+    )
+    roster = None
+    if roster_file:
+        try:
+            roster = load_roster(roster_file.name, roster_file.getvalue())
+            st.sidebar.success(f"✅ Rosters loaded for {roster[0].students} students")
+        except Exception as e:
+            st.sidebar.error(f"Error reading roster file: {e}")
+    co_enrollment_counts, roster_edges = roster if roster else (None, None)
+    
+    # Student count and capacity input
+    if program_filter == "All Programs":
+        if 'student_counts' not in st.session_state:
+            st.session_state.student_counts = {program: 1 for program in programs_list}
+        if 'section_capacities' not in st.session_state:
+            st.session_state.section_capacities = {program: 40 for program in programs_list}
+        
+        with st.sidebar:
+            program_settings_fragment(programs_list)
+        
+        student_counts = st.session_state.student_counts
+        section_capacities = st.session_state.section_capacities
+        
+        pool_shared_courses = st.sidebar.checkbox(
+            "Pool Shared Courses",
+            value=False,
+            help="Run courses offered by several programs (e.g. COM107) as combined sections "
+                 "scheduled once for all contributing programs"
+        )
+        
+    else:
+        student_count = st.sidebar.number_input("Enter Number of Students", min_value=1, step=1)
+        section_capacity = st.sidebar.number_input(
+            "Section Capacity",
+            min_value=1,
+            max_value=100,
+            value=40,
+            step=1,
+            help="Maximum students per section (default: 40)"
+        )
+        section_capacities = {program_filter: section_capacity}
+
+    # Generate report
+    if st.sidebar.button("Generate Report"):
+        # Scheduling modules load on the first report, not with the dashboard
+        from diagnostics import fallback_table, feasibility_check, slot_utilization
+        from reports import REPORT_COLUMNS, build_pooled_reports, build_program_report
+        from rosters import student_clashes
+
+        st.session_state.pop("calendar_term", None)
+        catalog_name = selected_catalog_year if selected_catalog_year else "Custom_Upload"
+        
+        if program_filter == "All Programs":
+            all_programs_df = catalog_df[
+                catalog_df["semester"] == semester_filter
+            ][["program", "course_code", "course_title", "college"]].copy()
+            
+            if all_programs_df.empty:
+                st.warning("No courses found for the selected Semester.")
+            else:
+                all_results = []
+                optimization_scores = []
+                
+                # Skip programs whose student count is 0
+                all_programs_df = all_programs_df[all_programs_df["program"].map(lambda p: student_counts.get(p, 1) != 0)]
+                sized_df = size_sections(all_programs_df, student_counts, section_capacities, enrollment_df, semester_filter)
+                pooling_summary = None
+                fallbacks = []
+                feasibility_df = feasibility_check(sized_df, include_weekend_courses)
+                flag_infeasible(feasibility_df)
+                
+                if pool_shared_courses:
+                    pooled_report_df, results, sections_before, sections_after = build_pooled_reports(
+                        sized_df, section_capacities, semester_filter, catalog_name, include_weekend_courses,
+                        optimize_seconds=optimization_seconds, conflict_edges=roster_edges, fallbacks=fallbacks
+                    )
+                    optimization_scores = [(result.history[0][1], result.score) for result in results]
+                    if not pooled_report_df.empty:
+                        all_results.append(pooled_report_df)
+                    pooling_summary = (sections_before, sections_after)
+                else:
+                    # Co-enrolled courses of programs scheduled earlier stay busy for later ones
+                    placed_courses = {} if roster_edges else None
+                    for program, program_df in sized_df.groupby("program"):
+                        if program_df["required sections"].sum() > 0:
+                            program_result_df, result = build_program_report(
+                                program_df, None, None,
+                                semester_filter, catalog_name, include_weekend_courses,
+                                optimize_seconds=optimization_seconds, conflict_edges=roster_edges,
+                                fallbacks=fallbacks, placed_courses=placed_courses
+                            )
+                            if result:
+                                optimization_scores.append((result.history[0][1], result.score))
+                            all_results.append(program_result_df)
+                
+                if all_results:
+                    final_df = pd.concat(all_results, ignore_index=True)
+                    final_df = final_df[REPORT_COLUMNS]
+                    
+                    st.success("✅ Report generated for all programs!")
+                    if pooling_summary:
+                        sections_before, sections_after = pooling_summary
+                        st.info(f"Pooled shared courses: {sections_before} program sections → {sections_after} pooled sections "
+                                f"({sections_before - sections_after} fewer)")
+                    if optimization_scores:
+                        initial_total = sum(initial for initial, _ in optimization_scores)
+                        optimized_total = sum(optimized for _, optimized in optimization_scores)
+                        st.info(f"Timetable penalty score: {initial_total:,.1f} → {optimized_total:,.1f} (lower is better)")
+                    
+                    storage.save_report(final_df, program_filter, semester_filter, catalog_name)
+                    clashes_df = student_clashes(final_df, co_enrollment_counts) if co_enrollment_counts else None
+                    diagnostics = (feasibility_df, fallback_table(fallbacks), slot_utilization(final_df))
+                    report_results_fragment(final_df, program_filter, semester_filter, catalog_name, student_counts, section_capacities, clashes_df, diagnostics)
+                else:
+                    st.warning("No data found for any programs in the selected semester (all programs may have 0 students).")
+        
+        else:
+            # Single program logic
+            df = catalog_df[
+                (catalog_df["program"] == program_filter) & 
+                (catalog_df["semester"] == semester_filter)
+            ][["program", "course_code", "course_title", "college"]].copy()
+            
+            if df.empty:
+                st.warning("No courses found for the selected Program and Semester.")
+            else:
+                df = size_sections(df, student_count, section_capacity, enrollment_df, semester_filter)
+                feasibility_df = feasibility_check(df, include_weekend_courses)
+                flag_infeasible(feasibility_df)
+                fallbacks = []
+                df, optimization_result = build_program_report(
+                    df, None, None, semester_filter, catalog_name,
+                    include_weekend_courses, optimize_seconds=optimization_seconds,
+                    conflict_edges=roster_edges, fallbacks=fallbacks
+                )
+                df = df[REPORT_COLUMNS]
+                
+                st.success("✅ Report generated!")
+                if optimization_result:
+                    st.info(f"Timetable penalty score: {optimization_result.history[0][1]:,.1f} → {optimization_result.score:,.1f} (lower is better)")
+                
+                storage.save_report(df, program_filter, semester_filter, catalog_name)
+                clashes_df = student_clashes(df, co_enrollment_counts) if co_enrollment_counts else None
+                diagnostics = (feasibility_df, fallback_table(fallbacks), slot_utilization(df))
+                report_results_fragment(df, program_filter, semester_filter, catalog_name, section_capacities=section_capacities, clashes_df=clashes_df, diagnostics=diagnostics)
+
+    if program_filter == "All Programs":
+        sweep_df = catalog_df[catalog_df["semester"] == semester_filter][["program", "course_code", "course_title", "college"]]
+        scenario_sweep_fragment(sweep_df, enrollment_df, semester_filter)
+    
+    schedule_history_fragment()
+    
+    # Room Allocation System link
+    st.markdown("---")
+    st.markdown("""
+    <div style='text-align: center; margin-bottom: 20px;'>
+        <h2 style='color: white !important; text-shadow: 3px 3px 6px rgba(0,0,0,0.8) !important; 
+                   font-weight: bold !important; margin: 0 !important; font-size: 2rem !important;
+                   font-family: Arial Black, sans-serif !important;'>
+            🏢 Additional Tools
+        </h2>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("🏫 Go to Room Allocation System", use_container_width=True, type="primary"):
+            st.info("Opening Room Allocation System...")
+            st.markdown("[🏫 Click here to access Room Allocation System](https://iobm-room-allocation-system.streamlit.app)")
+    
+    # Footer
+    st.markdown("---")
+    st.markdown("""
+    <div style='text-align: center; color: white !important; font-size: 14px; margin-top: 30px; 
+                text-shadow: 3px 3px 6px rgba(0,0,0,0.8) !important; font-weight: bold !important;'>
+        <p style='color: white !important; margin: 0 !important;'>
+            <strong style='color: white !important;'>Development Team:</strong> Fahad Hassan, Ali Hasnain Abro | 
+            <strong style='color: white !important;'>Supervisor:</strong> Dr. Rabiya Sabri | 
+            <strong style='color: white !important;'>Designer:</strong> Habibullah Rajpar
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
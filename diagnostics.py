@@ -0,0 +1,146 @@
+from bisect import bisect_right
+from collections import defaultdict, namedtuple
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from scheduler import build_slot_grid, is_lab_course, parse_slot, split_slot_grid
+
+DAY_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+FALLBACK_COLUMNS = ["program", "course_code", "course_title", "fallback sections"]
+
+SlotUtilization = namedtuple("SlotUtilization", ["programs", "slots", "counts"])
+
+def slots_overlap(a, b):
+    return bool(set(a.days) & set(b.days)) and a.start < b.end and b.start < a.end
+
+def max_weight_disjoint(intervals):
+    """Largest total weight of pairwise non-overlapping (start, end, weight) intervals
+
+    Weighted interval scheduling: intervals sorted by end, with a binary
+    search for the last one ending before each start.
+    """
+    intervals = sorted(intervals, key=lambda interval: interval[1])
+    ends = [end for _, end, _ in intervals]
+    best = [0]
+    for start, end, weight in intervals:
+        previous = bisect_right(ends, start)
+        best.append(max(best[-1], best[previous] + weight))
+    return best[-1]
+
+@lru_cache(maxsize=None)
+def max_disjoint_slots(slots):
+    """Upper bound on the number of slots in the tuple usable together without overlapping
+
+    A slot meeting on k days is split into k intervals of weight 1/k, so a
+    set of non-overlapping slots scores its size summed over the days; the
+    best weight per day bounds that sum. The bound is exact on grids whose
+    multi-day slots share their day pattern, and takes O(n log n) per day.
+    """
+    day_intervals = defaultdict(list)
+    for slot in slots:
+        for day in set(slot.days):
+            day_intervals[day].append((slot.start, slot.end, Fraction(1, len(set(slot.days)))))
+    return int(sum(max_weight_disjoint(intervals) for intervals in day_intervals.values()))
+
+@lru_cache(maxsize=None)
+def grid_capacity(program_name, allow_weekend_courses=True):
+    """(disjoint lecture slots, disjoint lab slots, disjoint slots overall, lecture slots, lab slots)"""
+    slot_grid = build_slot_grid(program_name, allow_weekend_courses)
+    lab_slots, lecture_slots = split_slot_grid(slot_grid)
+    return (
+        max_disjoint_slots(tuple(lecture_slots)),
+        max_disjoint_slots(tuple(lab_slots)),
+        max_disjoint_slots(tuple(slot_grid)),
+        len(lecture_slots),
+        len(lab_slots),
+    )
+
+def feasibility_check(sized_df, allow_weekend_courses=True):
+    """Lower-bound feasibility of each program's courses against its time grid, before scheduling
+
+    Section 1 of a program takes every course with at least one section, so
+    it needs that many mutually non-overlapping slots (lectures and labs
+    separately and together). A course also never reuses a slot across its
+    sections, so its section count cannot exceed its eligible slots. A
+    program failing either bound is infeasible: the scheduler will fall
+    back to random, clashing placements. Returns one row per program.
+    """
+    active_df = sized_df[sized_df["required sections"] > 0]
+    programs = active_df["program"].unique()
+    capacity = np.array(
+        [grid_capacity(program, allow_weekend_courses) for program in programs], dtype=int
+    ).reshape(-1, 5)
+    capacity_df = pd.DataFrame(capacity, index=programs, columns=[
+        "lecture capacity", "lab capacity", "slot capacity", "lecture slots", "lab slots"
+    ])
+
+    # Labs fall back to lecture slots when the grid has no lab session
+    has_lab_slots = active_df["program"].map(capacity_df["lab slots"]).to_numpy() > 0
+    is_lab = active_df["course_title"].map(is_lab_course).to_numpy(dtype=bool) & has_lab_slots
+    courses = active_df.assign(lab=is_lab, lecture=~is_lab)
+
+    per_program = courses.groupby("program").agg(
+        lecture_courses=("lecture", "sum"),
+        lab_courses=("lab", "sum"),
+    )
+    per_title = courses.groupby(["program", "course_title", "lab"])["required sections"].sum().reset_index()
+    per_title["eligible"] = np.where(
+        per_title["lab"],
+        per_title["program"].map(capacity_df["lab slots"]),
+        per_title["program"].map(capacity_df["lecture slots"]),
+    )
+    per_title["over"] = per_title["required sections"] > per_title["eligible"]
+    per_program["max sections per course"] = per_title.groupby("program")["required sections"].max()
+    per_program["courses over slot limit"] = per_title.groupby("program")["over"].sum()
+
+    report_df = per_program.join(capacity_df).rename(columns={
+        "lecture_courses": "lecture courses per section",
+        "lab_courses": "lab courses per section",
+    })
+    report_df["feasible"] = (
+        (report_df["lecture courses per section"] <= report_df["lecture capacity"])
+        & (report_df["lab courses per section"] <= report_df["lab capacity"])
+        & (report_df["lecture courses per section"] + report_df["lab courses per section"] <= report_df["slot capacity"])
+        & (report_df["courses over slot limit"] == 0)
+    )
+    return report_df.drop(columns=["lecture slots", "lab slots"]).reset_index().rename(columns={"index": "program"})
+
+def fallback_table(fallbacks):
+    """Fallback placements per course from (program, course_code, course_title, section) records"""
+    if not fallbacks:
+        return pd.DataFrame(columns=FALLBACK_COLUMNS)
+    records = pd.DataFrame(fallbacks, columns=["program", "course_code", "course_title", "section"])
+    return (
+        records.groupby(["program", "course_code", "course_title"]).size()
+        .rename("fallback sections").reset_index()
+        .sort_values("fallback sections", ascending=False, kind="stable").reset_index(drop=True)
+    )
+
+def slot_utilization(report_df):
+    """Sections meeting in each time slot per program, as arrays ready for a heatmap
+
+    Returns SlotUtilization(programs, slot labels in weekday and start time
+    order, counts) where counts[i, j] is the number of sections of
+    programs[i] in slots[j].
+    """
+    labels = report_df["days"].astype(str) + " " + report_df["time's"].astype(str)
+    program_codes, programs = pd.factorize(report_df["program"], sort=True)
+    label_codes, slots = pd.factorize(labels)
+
+    def slot_order(label_index):
+        slot = parse_slot(report_df["days"].iloc[label_index], report_df["time's"].iloc[label_index])
+        first_day = min(DAY_ORDER.index(day) if day in DAY_ORDER else len(DAY_ORDER) for day in slot.days)
+        return first_day, slot.start, slot.day_label
+
+    first_rows = pd.Series(np.arange(len(labels))).groupby(label_codes).first().to_numpy()
+    order = sorted(range(len(slots)), key=lambda j: slot_order(first_rows[j]))
+    rank = np.empty(len(slots), dtype=int)
+    rank[order] = np.arange(len(slots))
+
+    counts = np.zeros((len(programs), len(slots)), dtype=int)
+    np.add.at(counts, (program_codes, rank[label_codes]), 1)
+    return SlotUtilization(list(programs), [slots[j] for j in order], counts)
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+from catalog_store import normalize_semester_name
+
+DEFAULT_SECTION_CAPACITY = 40
+
+ENROLLMENT_KEYS = ['program', 'semester', 'course_code']
+ENROLLMENT_COUNTS = ['active students', 'failed/withdrawn students']
+
+def create_enrollment_template():
+    """Create a template enrollment table for upload"""
+    template_data = {
+        'program': ['BBA', 'BBA', 'BBA', 'MBA'],
+        'semester': ['one', 'one', 'two', 'one'],
+        'course_code': ['ACC101', 'MGT101', 'ECO102', 'MBA501'],
+        'active students': [120, 118, 95, 40],
+        'failed/withdrawn students': [6, 0, 12, 2]
+    }
+
+    return pd.DataFrame(template_data)
+
+def enrollment_keys(df, semester=None):
+    """(program, normalized semester, stripped course code) join keys
+
+    `semester` is used for every row when `df` has no semester column.
+    """
+    semesters = df['semester'] if 'semester' in df.columns else pd.Series(semester, index=df.index)
+    return pd.DataFrame({
+        'program': df['program'].astype(str).str.strip(),
+        'semester': semesters.map(normalize_semester_name),
+        'course_code': df['course_code'].fillna('').astype(str).str.strip(),
+    }, index=df.index)
+
+def normalize_enrollment(enrollment_df):
+    """Validate an enrollment table and sum duplicate (program, semester, course_code) rows
+
+    Raises ValueError naming any missing required column.
+    """
+    enrollment_df = enrollment_df.copy()
+    enrollment_df.columns = enrollment_df.columns.str.lower().str.strip()
+
+    missing_columns = [col for col in ENROLLMENT_KEYS + ['active students'] if col not in enrollment_df.columns]
+    if missing_columns:
+        raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
+
+    if 'failed/withdrawn students' not in enrollment_df.columns:
+        enrollment_df['failed/withdrawn students'] = 0
+
+    counts = enrollment_df[ENROLLMENT_COUNTS].apply(pd.to_numeric, errors='coerce').fillna(0).astype(int)
+    return pd.concat([enrollment_keys(enrollment_df), counts], axis=1).groupby(ENROLLMENT_KEYS, as_index=False).sum()
+
+def per_program(values, programs, default):
+    """Broadcast a {program: value} mapping or a single value onto a program column"""
+    if isinstance(values, dict):
+        return programs.map(values).fillna(default).to_numpy()
+    return np.full(len(programs), default if values is None else values)
+
+def size_sections(courses_df, student_counts, section_capacities, enrollment_df=None, semester=None,
+                  default_capacity=DEFAULT_SECTION_CAPACITY):
+    """Enrollment and required-section columns for every course row in one vectorized pass
+
+    `student_counts` and `section_capacities` are {program: value} mappings or
+    single values. Rows found in the normalized `enrollment_df` use its active
+    and failed/withdrawn counts; all other rows use the program's student count.
+    `semester` applies to every row when `courses_df` has no semester column.
+    """
+    sized_df = courses_df.copy()
+    active = per_program(student_counts, sized_df['program'], 1).astype(int)
+    failed = np.zeros(len(sized_df), dtype=int)
+
+    if enrollment_df is not None and not enrollment_df.empty:
+        matched = enrollment_keys(sized_df, semester).merge(enrollment_df, on=ENROLLMENT_KEYS, how='left')
+        found = matched['active students'].notna().to_numpy()
+        active = np.where(found, matched['active students'].fillna(0).to_numpy(), active).astype(int)
+        failed = matched['failed/withdrawn students'].fillna(0).to_numpy().astype(int)
+
+    capacity = per_program(section_capacities, sized_df['program'], default_capacity).astype(int)
+    total = active + failed
+
+    sized_df['failed/withdrawn students'] = failed
+    sized_df['active students'] = active
+    sized_df['total student strength'] = total
+    sized_df['required sections'] = -(-total // np.maximum(capacity, 1))
+    return sized_df
+
+def sections_for_capacities(totals, capacities):
+    """Required sections for every (course, capacity) pair as a len(totals) x len(capacities) array"""
+    totals = np.asarray(totals, dtype=int)[:, None]
+    capacities = np.maximum(np.asarray(capacities, dtype=int), 1)[None, :]
+    return -(-totals // capacities)
@@ -0,0 +1,100 @@
+import streamlit as st
+
+from theme import set_background_image
+
+# User credentials and display names
+USERS = {
+    "fahadhassan": {"password": "iobm1", "display_name": "Fahad Hassan"},
+    "alihasnain": {"password": "iobm2", "display_name": "Ali Hasnain"},
+    "habibullah": {"password": "iobm3", "display_name": "Habibullah"},
+    "rabiyasabri": {"password": "iobm4", "display_name": "Rabiya Sabri"}
+}
+
+def login_page():
+    """Display login page"""
+    set_background_image()
+    
+    # Additional CSS for login page
+    st.markdown("""
+    <style>
+    .app-title {
+        font-size: 5rem;
+        font-weight: bold;
+        color: white !important;
+        margin: 10px 0;
+        text-shadow: 3px 3px 6px rgba(0,0,0,0.7);
+        font-family: 'Arial Black', sans-serif;
+    }
+    
+    .app-subtitle {
+        font-size: 3rem;
+        color: white !important;
+        margin-bottom: 10px;
+        font-weight: 600;
+        text-shadow: 2px 2px 4px rgba(0,0,0,0.7);
+    }
+    
+    .login-title {
+        font-size: 2rem;
+        color: white;
+        margin-bottom: 25px;
+        text-align: center;
+        font-weight: bold;
+        text-shadow: 3px 3px 6px rgba(0,0,0,0.7);
+    }
+    
+    .credits-text {
+        color: white !important;
+        font-size: 14px;
+        font-weight: bold;
+        text-shadow: 2px 2px 4px rgba(0,0,0,0.7);
+    }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    # Main content
+    col_left, col_right = st.columns([1, 1], gap="large")
+    
+    # Left side - Logo and App Name
+    with col_left:
+        try:
+            col1, col2, col3 = st.columns([0.5, 1, 0.5])
+            with col2:
+                st.image("iobm.png", width=250)
+        except:
+            st.markdown('<div style="text-align: center;"><h1 style="color: white;">IOBM</h1></div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div style="text-align: center; margin-top: 20px;">
+            <h1 class="app-title">SSK ACMS</h1>
+            <p class="app-subtitle">Academic Course Management System</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Right side - Login Form
+    with col_right:
+        st.markdown('<h2 class="login-title">🔐 Login</h2>', unsafe_allow_html=True)
+        
+        username = st.text_input("👤 Username", placeholder="Enter your username")
+        password = st.text_input("🔒 Password", type="password", placeholder="Enter your password")
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        if st.button("🚀 Login", use_container_width=True, type="primary"):
+            username_lower = username.lower()
+            password_lower = password.lower()
+            
+            if username_lower in USERS and USERS[username_lower]["password"] == password_lower:
+                st.session_state.logged_in = True
+                st.session_state.username = username_lower
+                st.success("✅ Login successful!")
+                st.rerun()
+            else:
+                st.error("❌ Invalid username or password!")
+    
+    # Credits
+    st.markdown("""
+    <div style='text-align: center; margin-top: 50px; padding-top: 20px; border-top: 2px solid rgba(255,255,255,0.3);'>
+        <p class='credits-text'><strong>Development Team:</strong> Fahad Hassan, Ali Hasnain Abro | <strong>Supervisor:</strong> Dr. Rabiya Sabri | <strong>Designer:</strong> Habibullah Rajpar</p>
+    </div>
+    """, unsafe_allow_html=True)
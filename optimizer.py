@@ -0,0 +1,256 @@
+import math
+import time
+import random
+from collections import Counter, defaultdict, namedtuple
+
+import numpy as np
+
+from scheduler import build_slot_grid, course_conflicts, external_conflicts, split_slot_grid, eligible_slots_for
+
+# Penalty weights for each quality metric; lower total score is better
+DEFAULT_WEIGHTS = {
+    "clashes": 1000.0,        # overlapping classes inside one section
+    "course_overlap": 50.0,   # two sections of the same course in one slot
+    "co_enrollment": 200.0,   # overlapping sections of two courses that share students
+    "idle_minutes": 0.05,     # student idle time between classes per section and day
+    "weekend": 5.0,           # each class meeting on a weekend
+    "late_evening": 3.0,      # each class ending after LATE_EVENING_START
+    "slot_balance": 1.0,      # sum of squared slot loads across all courses
+}
+
+# Classes ending after this many minutes past midnight count as late evening
+LATE_EVENING_START = 18 * 60
+
+OptimizationResult = namedtuple("OptimizationResult", ["schedule", "score", "metrics", "history"])
+
+class ScheduleState:
+    """Slot assignment for every course section plus the counters needed for O(1) move deltas"""
+
+    def __init__(self, courses, sections, slot_grid, slot_index, weights, fixed=(), conflicts=None, external=None):
+        self.slot_grid = slot_grid
+        self.weights = weights
+        n_slots = len(slot_grid)
+
+        starts = np.array([slot.start for slot in slot_grid])
+        ends = np.array([slot.end for slot in slot_grid])
+        shares_day = np.array([[bool(set(a.days) & set(b.days)) for b in slot_grid] for a in slot_grid], dtype=bool)
+        self.overlap = shares_day & (starts[:, None] < ends[None, :]) & (starts[None, :] < ends[:, None])
+
+        self.weekend_cost = np.array([float(slot.is_weekend) for slot in slot_grid])
+        self.late_cost = (ends > LATE_EVENING_START).astype(float)
+        self.duration = ends - starts
+
+        lab_slots, lecture_slots = split_slot_grid(slot_grid)
+        grid_position = {slot: i for i, slot in enumerate(slot_grid)}
+
+        # One entry per placement, in the order assign_schedule() emits them
+        self.course_of, self.position_of, self.section_of, self.eligible = [], [], [], []
+        course_ids = {}
+        for position, (course, required_sections) in enumerate(zip(courses, sections)):
+            course_id = course_ids.setdefault(course, len(course_ids))
+            eligible = [grid_position[slot] for slot in eligible_slots_for(course, lab_slots, lecture_slots)]
+            for sec in range(1, required_sections + 1):
+                self.course_of.append(course_id)
+                self.position_of.append(position)
+                self.section_of.append(sec)
+                self.eligible.append(eligible)
+
+        # Per course position, the positions of courses it shares students with (see course_conflicts())
+        self.conflicts = [list(others) for others in conflicts] if conflicts else [[] for _ in courses]
+        self.conflict_matrix = np.zeros((len(courses), len(courses)), dtype=int)
+        for position, others in enumerate(self.conflicts):
+            self.conflict_matrix[position, others] = 1
+        # Per course position and grid slot, co-enrolled classes of other programs it would overlap
+        self.external_overlap = np.zeros((len(courses), n_slots), dtype=int)
+        for position, slots in enumerate(external or ()):
+            for slot in slots:
+                shares = np.array([bool(set(slot.days) & set(grid_slot.days)) for grid_slot in slot_grid], dtype=bool)
+                self.external_overlap[position] += shares & (starts < slot.end) & (slot.start < ends)
+
+        self.assignment = list(slot_index)
+        n_sections = max([*self.section_of, *(sec for sec, _ in fixed)], default=0) + 1
+
+        self.section_load = np.zeros((n_sections, n_slots), dtype=int)
+        self.course_load = np.zeros((len(course_ids), n_slots), dtype=int)
+        self.position_load = np.zeros((len(courses), n_slots), dtype=int)
+        self.slot_load = np.zeros(n_slots, dtype=int)
+        self.day_slots = defaultdict(Counter)
+        for i, slot_id in enumerate(self.assignment):
+            self._count(i, slot_id, 1)
+
+        # Classes scheduled elsewhere (pooled courses) occupy their sections but never move
+        for sec, slot_id in fixed:
+            self.section_load[sec, slot_id] += 1
+            for day in slot_grid[slot_id].days:
+                self.day_slots[sec, day][slot_id] += 1
+
+    def _count(self, i, slot_id, step):
+        sec = self.section_of[i]
+        self.section_load[sec, slot_id] += step
+        self.course_load[self.course_of[i], slot_id] += step
+        self.position_load[self.position_of[i], slot_id] += step
+        self.slot_load[slot_id] += step
+        for day in self.slot_grid[slot_id].days:
+            self.day_slots[sec, day][slot_id] += step
+
+    def day_idle_minutes(self, slot_counts):
+        """Idle minutes between the first and last class of one section on one day"""
+        active = [slot_id for slot_id, count in slot_counts.items() if count > 0]
+        if len(active) < 2:
+            return 0
+        first = min(self.slot_grid[s].start for s in active)
+        last = max(self.slot_grid[s].end for s in active)
+        busy = sum(self.duration[s] * slot_counts[s] for s in active)
+        return max(last - first - busy, 0)
+
+    def metrics(self):
+        """Full, vectorized evaluation of every metric"""
+        # Pairs of overlapping classes inside each section (a class always overlaps itself)
+        pair_overlaps = np.einsum("si,ij,sj->", self.section_load, self.overlap.astype(int), self.section_load)
+        clashes = (pair_overlaps - self.section_load.sum()) / 2
+        course_overlap = (self.course_load * (self.course_load - 1) / 2).sum()
+        # Overlapping section pairs across every pair of co-enrolled courses
+        overlapping = self.position_load @ self.overlap.astype(int)
+        co_enrollment = (
+            ((self.conflict_matrix @ self.position_load) * overlapping).sum() / 2
+            + (self.position_load * self.external_overlap).sum()
+        )
+        idle = sum(self.day_idle_minutes(counts) for counts in self.day_slots.values())
+
+        return {
+            "clashes": float(clashes),
+            "course_overlap": float(course_overlap),
+            "co_enrollment": float(co_enrollment),
+            "idle_minutes": float(idle),
+            "weekend": float(self.slot_load @ self.weekend_cost),
+            "late_evening": float(self.slot_load @ self.late_cost),
+            "slot_balance": float((self.slot_load ** 2).sum()),
+        }
+
+    def score(self, metrics=None):
+        metrics = metrics or self.metrics()
+        return sum(self.weights[name] * value for name, value in metrics.items())
+
+    def move_delta(self, i, new_slot):
+        """Score change from moving placement `i` to `new_slot`, touching only the affected counters"""
+        old_slot = self.assignment[i]
+        sec, course = self.section_of[i], self.course_of[i]
+        w = self.weights
+
+        section_row = self.section_load[sec]
+        clash_delta = (
+            section_row @ self.overlap[new_slot] - self.overlap[new_slot, old_slot]
+            - (section_row @ self.overlap[old_slot] - 1)
+        )
+        course_delta = self.course_load[course, new_slot] - (self.course_load[course, old_slot] - 1)
+        position = self.position_of[i]
+        shared = self.conflicts[position]
+        co_enrollment_delta = self.external_overlap[position, new_slot] - self.external_overlap[position, old_slot]
+        if shared:
+            shared_load = self.position_load[shared].sum(axis=0)
+            co_enrollment_delta += shared_load @ self.overlap[new_slot] - shared_load @ self.overlap[old_slot]
+        balance_delta = 2 * (self.slot_load[new_slot] - self.slot_load[old_slot]) + 2
+
+        affected_days = set(self.slot_grid[old_slot].days) | set(self.slot_grid[new_slot].days)
+        idle_before = sum(self.day_idle_minutes(self.day_slots[sec, day]) for day in affected_days)
+        self._count(i, old_slot, -1)
+        self._count(i, new_slot, 1)
+        idle_after = sum(self.day_idle_minutes(self.day_slots[sec, day]) for day in affected_days)
+        self._count(i, new_slot, -1)
+        self._count(i, old_slot, 1)
+
+        return (
+            w["clashes"] * clash_delta
+            + w["course_overlap"] * course_delta
+            + w["co_enrollment"] * co_enrollment_delta
+            + w["idle_minutes"] * (idle_after - idle_before)
+            + w["weekend"] * (self.weekend_cost[new_slot] - self.weekend_cost[old_slot])
+            + w["late_evening"] * (self.late_cost[new_slot] - self.late_cost[old_slot])
+            + w["slot_balance"] * balance_delta
+        )
+
+    def apply(self, i, new_slot):
+        self._count(i, self.assignment[i], -1)
+        self._count(i, new_slot, 1)
+        self.assignment[i] = new_slot
+
+    def to_schedule(self, assignment=None):
+        assignment = self.assignment if assignment is None else assignment
+        return [
+            (sec, self.slot_grid[slot_id].day_label, self.slot_grid[slot_id].time_label)
+            for sec, slot_id in zip(self.section_of, assignment)
+        ]
+
+def optimize_schedule(courses, sections, slot_grid, schedule, time_budget=2.0, seed=0,
+                      weights=None, start_temperature=50.0, end_temperature=0.5, reserved=None, conflicts=None,
+                      external=None):
+    """Improve a feasible schedule by simulated annealing within `time_budget` seconds
+
+    `schedule` is the (section, days, time) list from assign_schedule() for the
+    same courses and sections; `reserved`, `conflicts` and `external` are the
+    same (section, TimeSlot) list and per-position conflicts passed to it. Returns an OptimizationResult with the best schedule found,
+    its score and metrics, and a history of (elapsed seconds, best score) pairs.
+    """
+    weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+    slot_lookup = {(slot.day_label, slot.time_label): i for i, slot in enumerate(slot_grid)}
+    slot_index = [slot_lookup[day, times] for _, day, times in schedule]
+    fixed = [
+        (sec, slot_lookup[slot.day_label, slot.time_label])
+        for sec, slot in reserved or ()
+        if (slot.day_label, slot.time_label) in slot_lookup
+    ]
+
+    state = ScheduleState(courses, sections, slot_grid, slot_index, weights, fixed, conflicts, external)
+    rng = random.Random(seed)
+
+    current = best = float(state.score())
+    best_assignment = list(state.assignment)
+    started = time.perf_counter()
+    history = [(0.0, best)]
+
+    movable = [i for i, eligible in enumerate(state.eligible) if len(eligible) > 1]
+    elapsed = 0.0
+    iteration = 0
+
+    while movable:
+        if iteration % 256 == 0:
+            elapsed = time.perf_counter() - started
+            if elapsed >= time_budget:
+                break
+            progress = elapsed / time_budget if time_budget else 1.0
+            temperature = start_temperature * (end_temperature / start_temperature) ** progress
+        iteration += 1
+
+        i = rng.choice(movable)
+        new_slot = rng.choice(state.eligible[i])
+        if new_slot == state.assignment[i]:
+            continue
+
+        delta = state.move_delta(i, new_slot)
+        if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+            state.apply(i, new_slot)
+            current += float(delta)
+            if current < best - 1e-9:
+                best = current
+                best_assignment = list(state.assignment)
+                history.append((time.perf_counter() - started, best))
+
+    state = ScheduleState(courses, sections, slot_grid, best_assignment, weights, fixed, conflicts, external)
+    metrics = state.metrics()
+    return OptimizationResult(state.to_schedule(), float(state.score(metrics)), metrics, history)
+
+def optimize_assignment(df, schedule, allow_weekend_courses=True, time_budget=2.0, seed=0, weights=None, reserved=None,
+                        conflict_edges=None, placed_courses=None):
+    """optimize_schedule() for the same DataFrame and arguments that were passed to assign_schedule()"""
+    program_name = df["program"].iloc[0] if not df.empty else ""
+    courses = tuple(df["course_title"])
+    sections = tuple(int(s) for s in df["required sections"])
+    slot_grid = build_slot_grid(program_name, allow_weekend_courses)
+    conflicts = course_conflicts(df["course_code"], conflict_edges) if conflict_edges else None
+    external = (
+        external_conflicts(df["course_code"], conflict_edges, placed_courses)
+        if conflict_edges and placed_courses else None
+    )
+
+    return optimize_schedule(courses, sections, slot_grid, schedule, time_budget, seed, weights, reserved=reserved,
+                             conflicts=conflicts, external=external)
@@ -0,0 +1,293 @@
+import random
+
+import numpy as np
+import pandas as pd
+
+from enrollment import DEFAULT_SECTION_CAPACITY, per_program, size_sections
+from optimizer import optimize_assignment
+from scheduler import (
+    assign_schedule, build_slot_grid, is_lab_course, parse_slot, place_pooled_sections, program_type_for,
+    record_placements
+)
+
+REPORT_COLUMNS = [
+    "program", "college", "section", "course_code", "course_title", "name", "ids",
+    "type name", "days", "time's", "failed/withdrawn students",
+    "active students", "total student strength", "required sections",
+    "semester_selected", "catalog_year", "pooled section"
+]
+
+def prepare_program_courses(program_df, student_count, section_capacity, semester, catalog_name):
+    """Add the enrollment, section and placeholder columns a timetable report needs
+
+    Rows already sized by size_sections() keep their counts; otherwise every
+    course gets `student_count` students split into `section_capacity` sections.
+    """
+    if "required sections" not in program_df.columns:
+        program_df = size_sections(program_df, student_count, section_capacity)
+    program_df = program_df.copy()
+    program_df["section"] = ""
+    program_df["name"] = "Faculty Member"
+    program_df["ids"] = ""
+    program_df["type name"] = ""
+    program_df["semester_selected"] = semester
+    program_df["catalog_year"] = catalog_name
+    program_df["pooled section"] = ""
+    return program_df
+
+def expand_schedule(program_df, schedule):
+    """One row per course section with its scheduled days and time, ordered by section then course"""
+    expanded_df = program_df.loc[program_df.index.repeat(program_df["required sections"])].copy()
+    expanded_df["section"] = expanded_df.groupby(level=0).cumcount() + 1
+    expanded_df["days"] = [day for _, day, _ in schedule]
+    expanded_df["time's"] = [times for _, _, times in schedule]
+    return expanded_df.sort_values(by=["section", "course_code"]).reset_index(drop=True)
+
+def record_fallbacks(fallbacks, courses_df, positions):
+    """Append (program, course_code, course_title, section) for (position, section) fallback pairs"""
+    if fallbacks is None:
+        return
+    for position, sec in positions:
+        row = courses_df.iloc[position]
+        fallbacks.append((row["program"], row["course_code"], row["course_title"], sec))
+
+def build_program_report(program_df, student_count, section_capacity, semester, catalog_name,
+                         allow_weekend_courses=True, seed=0, optimize_seconds=0, conflict_edges=None,
+                         reserved=None, fallbacks=None, placed_courses=None):
+    """Schedule one program's courses; returns (report rows, OptimizationResult or None)
+
+    Pass a frame from size_sections() with `student_count` and
+    `section_capacity` set to None to use per-course enrollment. `reserved`
+    (section, TimeSlot) pairs are kept free for pooled courses. Sections the
+    scheduler had to place at random are appended to the `fallbacks` list as
+    (program, course_code, course_title, section). A `placed_courses` dict
+    ({course_code: TimeSlots}) shared across programs keeps courses apart from
+    co-enrolled courses of programs scheduled earlier, and receives this
+    program's placements in turn.
+    """
+    program_df = prepare_program_courses(program_df, student_count, section_capacity, semester, catalog_name)
+    positions = [] if fallbacks is not None else None
+    schedule = assign_schedule(program_df, allow_weekend_courses, seed=seed, conflict_edges=conflict_edges,
+                               reserved=reserved, fallbacks=positions, placed_courses=placed_courses)
+    record_fallbacks(fallbacks, program_df, positions or [])
+
+    optimization_result = None
+    if optimize_seconds:
+        optimization_result = optimize_assignment(program_df, schedule, allow_weekend_courses, optimize_seconds,
+                                                  seed, reserved=reserved, conflict_edges=conflict_edges,
+                                                  placed_courses=placed_courses)
+        schedule = optimization_result.schedule
+
+    report_df = expand_schedule(program_df, schedule)
+    if placed_courses is not None:
+        record_placements(
+            placed_courses, report_df["course_code"], zip(report_df["section"], report_df["days"], report_df["time's"])
+        )
+    return report_df, optimization_result
+
+def pack_sections(contributors, capacity):
+    """First-fit-decreasing packing of whole program sections into pooled sections
+
+    `contributors` lists (program, students, sections); each program's
+    students are split evenly over its sections. Returns one list of
+    (program, section) members per pooled section; a pooled section stays
+    within `capacity` unless a single program section is already larger.
+    """
+    program_sections = sorted(
+        (
+            (students // sections + (sec <= students % sections), program, sec)
+            for program, students, sections in contributors
+            for sec in range(1, sections + 1)
+        ),
+        key=lambda item: -item[0]
+    )
+    loads, members = [], []
+    for size, program, sec in program_sections:
+        target = next((i for i, load in enumerate(loads) if load + size <= capacity), None)
+        if target is None:
+            loads.append(0)
+            members.append([])
+            target = len(loads) - 1
+        loads[target] += size
+        members[target].append((program, sec))
+    return members
+
+def pooling_keys(sized_df):
+    """(program type, course code, lab) columns that decide which course rows pool together"""
+    return pd.DataFrame({
+        "program_type": sized_df["program"].map(lambda program: program_type_for(program)[0]),
+        "code": sized_df["course_code"].astype(str).str.strip(),
+        # A program's lecture and lab rows share a code; pool each separately
+        "lab": sized_df["course_title"].map(is_lab_course),
+    }, index=sized_df.index)
+
+def pool_shared_courses(sized_df, section_capacities, default_capacity=DEFAULT_SECTION_CAPACITY):
+    """Merge course rows that several programs of the same program type share
+
+    Rows of a size_sections() frame are grouped by (program type, course code).
+    When two or more programs offer a code and their sections pack into fewer
+    sections of the smallest contributing capacity (see pack_sections()), the
+    code becomes one pooled row with the combined enrollment. Returns
+    (pooled rows, the remaining per-program rows); pooled rows carry the
+    "contributors" (program, sections before pooling) and the (program,
+    section) "members" of each pooled section. A program listing a code more
+    than once contributes its sections once; all of its rows are pooled.
+    """
+    keys = pooling_keys(sized_df)
+    shared = (keys["code"] != "") & (sized_df["required sections"] > 0)
+
+    candidates = sized_df[shared].assign(
+        program_type=keys["program_type"],
+        code=keys["code"],
+        lab=keys["lab"],
+        capacity=per_program(section_capacities, sized_df.loc[shared, "program"], default_capacity).astype(int),
+    ).drop_duplicates(["program_type", "code", "lab", "program"])
+    groups = candidates.groupby(["program_type", "code", "lab"], sort=True)
+
+    pooled_df = groups.agg(
+        program=("program", "first"),
+        college=("college", lambda colleges: ", ".join(sorted(set(colleges)))),
+        course_code=("course_code", "first"),
+        course_title=("course_title", lambda titles: titles.mode().iloc[0]),
+        **{
+            "failed/withdrawn students": ("failed/withdrawn students", "sum"),
+            "active students": ("active students", "sum"),
+            "total student strength": ("total student strength", "sum"),
+        },
+        capacity=("capacity", "min"),
+        programs=("program", "nunique"),
+    ).reset_index()
+    pooled_df["contributors"] = [
+        list(zip(group["program"], group["required sections"].astype(int)))
+        for _, group in groups
+    ]
+    pooled_df["members"] = [
+        pack_sections(
+            zip(group["program"], group["total student strength"].astype(int), group["required sections"].astype(int)),
+            max(int(capacity), 1)
+        )
+        for (_, group), capacity in zip(groups, pooled_df["capacity"])
+    ]
+    pooled_df["required sections"] = pooled_df["members"].map(len)
+    sections_before = pooled_df["contributors"].map(lambda contributors: sum(n for _, n in contributors))
+    pooled_df = pooled_df[(pooled_df["programs"] > 1) & (pooled_df["required sections"] < sections_before)]
+    pooled_df = pooled_df.reset_index(drop=True)
+
+    pooled_keys = set(zip(pooled_df["program_type"], pooled_df["code"], pooled_df["lab"]))
+    is_pooled = [key in pooled_keys for key in zip(keys["program_type"], keys["code"], keys["lab"])]
+    return pooled_df, sized_df[~np.array(is_pooled, dtype=bool)]
+
+def pooled_label(contributors):
+    """'Pooled: A, B' program labels for a column of contributor lists"""
+    return ["Pooled: " + ", ".join(sorted(program for program, _ in programs)) for programs in contributors]
+
+def pooled_section_id(program_type, code, lab, number):
+    """Identifier shared by every program section attending one pooled section, e.g. 'undergraduate/COM107-P2'"""
+    return f"{program_type}/{code}{'-LAB' if lab else ''}-P{number}"
+
+def build_pooled_reports(sized_df, section_capacities, semester, catalog_name, allow_weekend_courses=True,
+                         seed=0, optimize_seconds=0, conflict_edges=None, fallbacks=None):
+    """All Programs timetable where courses shared across programs run as pooled sections
+
+    Each pooled section is attended by whole program sections (its
+    "members"). Pooled sections are placed first, once per program type, at
+    times free for all of their members; each program's own courses are then
+    scheduled around them. Optimization applies to the per-program courses
+    only. Every member gets its own row under its real program and section,
+    and the rows of one pooled section share a "pooled section" id. Random
+    placements are collected in `fallbacks` as in build_program_report(),
+    under a "Pooled: <programs>" label. With `conflict_edges`, pooled times
+    and each program's placements are shared with the programs scheduled
+    after it (see build_program_report()). Returns (report rows,
+    OptimizationResults, sections before pooling, sections after pooling).
+    """
+    pooled_df, remaining_df = pool_shared_courses(sized_df, section_capacities)
+    reports, optimization_results = [], []
+    reserved = {}
+    pooled_sections = {}
+    placed_courses = {} if conflict_edges else None
+
+    for _, type_df in pooled_df.groupby("program_type", sort=False):
+        type_df = prepare_program_courses(type_df, None, None, semester, catalog_name)
+        # The first contributing program picks the program type's time grid
+        slot_grid = build_slot_grid(type_df["program"].iloc[0], allow_weekend_courses)
+        positions = []
+        schedule = place_pooled_sections(
+            tuple(type_df["course_title"]), list(type_df["members"]), slot_grid, random.Random(seed), positions
+        )
+
+        record_fallbacks(fallbacks, type_df.assign(program=pooled_label(type_df["contributors"])), positions)
+
+        entries = (
+            (program_type, code, lab, number, members)
+            for program_type, code, lab, course_members in zip(
+                type_df["program_type"], type_df["code"], type_df["lab"], type_df["members"]
+            )
+            for number, members in enumerate(course_members, start=1)
+        )
+        for (program_type, code, lab, number, members), (_, days, times) in zip(entries, schedule):
+            slot = parse_slot(days, times)
+            pooled_id = pooled_section_id(program_type, code, lab, number)
+            for program, sec in members:
+                reserved.setdefault(program, []).append((sec, slot))
+                pooled_sections[program, code, lab, sec] = (days, times, pooled_id)
+        if placed_courses is not None:
+            record_placements(placed_courses, type_df["code"].repeat(type_df["required sections"]), schedule)
+
+    if pooled_sections:
+        # Every pooled course row of a contributing program, once per program section
+        pooled_rows = sized_df.drop(index=remaining_df.index)
+        pooled_rows = prepare_program_courses(
+            pooled_rows.join(pooling_keys(pooled_rows)), None, None, semester, catalog_name
+        )
+        member_df = pooled_rows.loc[pooled_rows.index.repeat(pooled_rows["required sections"])].copy()
+        member_df["section"] = member_df.groupby(level=0).cumcount() + 1
+        member_df["days"], member_df["time's"], member_df["pooled section"] = zip(*(
+            pooled_sections[key]
+            for key in zip(member_df["program"], member_df["code"], member_df["lab"], member_df["section"])
+        ))
+        reports.append(member_df.reset_index(drop=True))
+
+    for program, program_df in remaining_df.groupby("program"):
+        if program_df["required sections"].sum() > 0:
+            report_df, result = build_program_report(
+                program_df, None, None, semester, catalog_name, allow_weekend_courses, seed=seed,
+                optimize_seconds=optimize_seconds, conflict_edges=conflict_edges,
+                reserved=reserved.get(program), fallbacks=fallbacks, placed_courses=placed_courses
+            )
+            if result:
+                optimization_results.append(result)
+            reports.append(report_df)
+
+    sections_before = int(sum(sections for contributors in pooled_df["contributors"] for _, sections in contributors))
+    sections_after = int(pooled_df["required sections"].sum())
+    if not reports:
+        return pd.DataFrame(columns=REPORT_COLUMNS), optimization_results, sections_before, sections_after
+    report_df = pd.concat(reports, ignore_index=True).sort_values(
+        by=["program", "section", "course_code"], kind="stable"
+    ).reset_index(drop=True)
+    # Pooling changes when sections meet, never how many rows a program section has
+    assert len(report_df) == sized_df["required sections"].sum(), "pooled report rows do not match sections"
+    return report_df[REPORT_COLUMNS], optimization_results, sections_before, sections_after
+
+def find_conflicts(report_rows):
+    """Pairs of rows in the same program and section whose meetings overlap
+
+    `report_rows` is an iterable of dicts with at least program, section,
+    days and time's. Returns a list of (index_a, index_b) pairs.
+    """
+    meetings = {}
+    for i, row in enumerate(report_rows):
+        slot = parse_slot(row["days"], row["time's"])
+        for day in slot.days:
+            meetings.setdefault((row["program"], row["section"], day), []).append((slot.start, slot.end, i))
+
+    conflicts = set()
+    for day_meetings in meetings.values():
+        day_meetings.sort()
+        active = []
+        for start, end, i in day_meetings:
+            active = [(other_end, j) for other_end, j in active if other_end > start]
+            conflicts.update((min(i, j), max(i, j)) for _, j in active)
+            active.append((end, i))
+    return sorted(conflicts)
@@ -0,0 +1,97 @@
+from collections import defaultdict, namedtuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from scheduler import parse_slot
+
+ROSTER_COLUMNS = ['student_id', 'course_code']
+
+CoEnrollment = namedtuple("CoEnrollment", ["course_codes", "matrix", "students"])
+
+def normalize_roster(roster_df):
+    """Validate a (student_id, course_code) roster and drop duplicate rows
+
+    Raises ValueError naming any missing required column.
+    """
+    roster_df = roster_df.copy()
+    roster_df.columns = roster_df.columns.str.lower().str.strip()
+
+    missing_columns = [col for col in ROSTER_COLUMNS if col not in roster_df.columns]
+    if missing_columns:
+        raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
+
+    roster_df = roster_df[ROSTER_COLUMNS].dropna()
+    roster_df['student_id'] = roster_df['student_id'].astype(str).str.strip()
+    roster_df['course_code'] = roster_df['course_code'].astype(str).str.strip()
+    return roster_df[roster_df['course_code'] != ''].drop_duplicates().reset_index(drop=True)
+
+def co_enrollment(roster_df):
+    """Course x course co-enrollment counts from a normalized roster
+
+    Builds the sparse student x course incidence matrix A and returns
+    A.T @ A, whose (i, j) entry is the number of students taking both
+    course i and course j (the diagonal holds course enrollment).
+    """
+    student_idx, students = pd.factorize(roster_df['student_id'])
+    course_idx, course_codes = pd.factorize(roster_df['course_code'])
+
+    incidence = sparse.csr_matrix(
+        (np.ones(len(roster_df), dtype=np.int32), (student_idx, course_idx)),
+        shape=(len(students), len(course_codes))
+    )
+    return CoEnrollment(list(course_codes), (incidence.T @ incidence).tocoo(), len(students))
+
+def shared_course_pairs(co):
+    """(course_a, course_b, shared students) for every distinct pair with a shared student"""
+    matrix = co.matrix
+    upper = matrix.row < matrix.col
+    codes = np.asarray(co.course_codes, dtype=object)
+    return pd.DataFrame({
+        'course_a': codes[matrix.row[upper]],
+        'course_b': codes[matrix.col[upper]],
+        'shared students': matrix.data[upper],
+    })
+
+def conflict_edges(co):
+    """{course_code: set of co-enrolled course codes} for assign_schedule()"""
+    edges = defaultdict(set)
+    for course_a, course_b in shared_course_pairs(co)[['course_a', 'course_b']].itertuples(index=False):
+        edges[course_a].add(course_b)
+        edges[course_b].add(course_a)
+    return dict(edges)
+
+def student_clashes(report_df, co):
+    """Co-enrolled course pairs that cannot be taken together in a generated timetable
+
+    Each course is split into components by title (a lecture and its lab
+    share a course code). A pair clashes when some component of one course
+    overlaps some component of the other in every section combination, so
+    students taking both have no clash-free choice. Returns one row per
+    clashing pair with the number of affected students, largest first.
+    """
+    pairs = shared_course_pairs(co)
+    codes = report_df['course_code'].astype(str).str.strip()
+    scheduled = set(codes)
+    pairs = pairs[pairs['course_a'].isin(scheduled) & pairs['course_b'].isin(scheduled)]
+
+    components = defaultdict(lambda: defaultdict(set))
+    for code, title, days, times in zip(codes, report_df['course_title'], report_df['days'], report_df["time's"]):
+        components[code][title].add(parse_slot(days, times))
+
+    def overlaps(a, b):
+        return bool(set(a.days) & set(b.days)) and a.start < b.end and b.start < a.end
+
+    def always_overlap(slots_a, slots_b):
+        return all(overlaps(a, b) for a in slots_a for b in slots_b)
+
+    clashing = np.array([
+        any(
+            always_overlap(slots_a, slots_b)
+            for slots_a in components[course_a].values()
+            for slots_b in components[course_b].values()
+        )
+        for course_a, course_b in zip(pairs['course_a'], pairs['course_b'])
+    ], dtype=bool)
+    return pairs[clashing].sort_values('shared students', ascending=False).reset_index(drop=True)
@@ -0,0 +1,110 @@
+"""What-if sweeps over section capacity and weekend policy for a whole semester"""
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from enrollment import sections_for_capacities
+from scheduler import IntervalIndex, build_slot_grid, parse_slot, schedule_courses
+
+SWEEP_CAPACITIES = list(range(25, 61, 5))
+WEEKEND_POLICIES = [True, False]
+
+# Below this many section placements per sweep, starting worker processes costs more than it saves
+PARALLEL_MIN_SECTIONS = 200_000
+
+SCENARIO_COLUMNS = [
+    "section capacity", "weekend courses", "sections", "slots used",
+    "fallback conflicts", "peak rooms", "room hours"
+]
+
+def scenario_metrics(programs, allow_weekend_courses=True, seed=0):
+    """Schedule every program of one scenario and measure it
+
+    `programs` is a sequence of (program, course titles, required sections).
+    Returns sections scheduled, distinct time slots used, placements that
+    overlap another class of the same section (the scheduler's fallback),
+    the peak number of classes running at once (rooms needed) and weekly
+    room hours.
+    """
+    sections_total = 0
+    fallback_conflicts = 0
+    slots_used = set()
+    meetings = []
+
+    for program, courses, sections in programs:
+        slot_grid = build_slot_grid(program, allow_weekend_courses)
+        schedule, _ = schedule_courses(tuple(courses), tuple(sections), slot_grid, allow_weekend_courses, seed)
+        section_busy = {}
+        sections_total += int(sum(sections))
+
+        for sec, days, times in schedule:
+            slot = parse_slot(days, times)
+            busy = section_busy.setdefault(sec, IntervalIndex())
+            fallback_conflicts += busy.overlaps(slot)
+            busy.add(slot)
+            slots_used.add((slot.day_label, slot.time_label))
+            meetings.extend((day, slot.start, slot.end) for day in slot.days)
+
+    return {
+        "weekend courses": allow_weekend_courses,
+        "sections": sections_total,
+        "slots used": len(slots_used),
+        "fallback conflicts": fallback_conflicts,
+        "peak rooms": peak_concurrency(meetings),
+        "room hours": round(sum(end - start for _, start, end in meetings) / 60, 1),
+    }
+
+def peak_concurrency(meetings):
+    """Largest number of (day, start, end) meetings in progress at the same moment"""
+    if not meetings:
+        return 0
+    day_codes, _ = pd.factorize(pd.Series([day for day, _, _ in meetings]))
+    # Offset each day so one sorted sweep covers the whole week
+    offsets = day_codes * 24 * 60
+    starts = offsets + np.array([start for _, start, _ in meetings])
+    ends = offsets + np.array([end for _, _, end in meetings])
+    times = np.concatenate([starts, ends])
+    # Ends sort before starts at the same minute, so back-to-back classes share a room
+    deltas = np.concatenate([np.ones(len(starts), dtype=int), -np.ones(len(ends), dtype=int)])
+    order = np.lexsort((deltas, times))
+    return int(np.cumsum(deltas[order]).max())
+
+def sweep_scenarios(sized_df, capacities=SWEEP_CAPACITIES, weekend_policies=WEEKEND_POLICIES, seed=0,
+                    max_workers=None):
+    """Evaluate every (capacity, weekend policy) scenario for the courses in `sized_df`
+
+    `sized_df` is a size_sections() frame for all programs of one semester;
+    sections for every capacity are computed in one vectorized step and large
+    sweeps are scheduled in a process pool. Returns one row per scenario
+    with SCENARIO_COLUMNS.
+    """
+    sized_df = sized_df[sized_df["total student strength"] > 0]
+    capacities = [int(capacity) for capacity in capacities]
+    section_grid = sections_for_capacities(sized_df["total student strength"], capacities)
+
+    groups = list(sized_df.reset_index(drop=True).groupby("program").indices.items())
+    titles = sized_df["course_title"].to_numpy()
+    jobs = []
+    for column, capacity in enumerate(capacities):
+        programs = [
+            (program, tuple(titles[rows]), tuple(int(s) for s in section_grid[rows, column]))
+            for program, rows in groups
+        ]
+        jobs.extend((capacity, programs, weekend) for weekend in weekend_policies)
+
+    if max_workers is None:
+        parallel = int(section_grid.sum()) * len(weekend_policies) >= PARALLEL_MIN_SECTIONS
+        max_workers = min(len(jobs), os.cpu_count() or 1) if parallel else 1
+
+    if max_workers > 1:
+        # Spawned workers avoid forking the threads of a running Streamlit server
+        with ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results = list(pool.map(scenario_metrics, *zip(*[(programs, weekend, seed) for _, programs, weekend in jobs])))
+    else:
+        results = [scenario_metrics(programs, weekend, seed) for _, programs, weekend in jobs]
+
+    rows = [{"section capacity": capacity, **metrics} for (capacity, _, _), metrics in zip(jobs, results)]
+    return pd.DataFrame(rows, columns=SCENARIO_COLUMNS)
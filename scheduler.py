@@ -0,0 +1,324 @@
+import os
+import re
+import csv
+import random
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, namedtuple
+from functools import lru_cache
+
+# Cached schedules kept per process; identical requests from any session reuse them
+SCHEDULE_CACHE_SIZE = 512
+
+# Time grid configuration, one row per bookable slot and program type
+TIME_GRID_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "time_grid.csv")
+PROGRAM_TYPES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "program_types.csv")
+
+# Slot boundaries must fall on this many minutes
+GRID_MINUTES = 15
+
+WEEKEND_DAYS = ["Saturday", "Sunday"]
+
+LAB_PATTERN = re.compile(r"\blab\b", re.IGNORECASE)
+
+class TimeSlot(namedtuple("TimeSlot", ["days", "start", "end", "session", "day_label", "time_label"])):
+    """One bookable slot: the days it meets on and its [start, end) minutes past midnight"""
+
+    __slots__ = ()
+
+    @property
+    def is_weekend(self):
+        return all(day in WEEKEND_DAYS for day in self.days)
+
+def parse_time(value):
+    """Convert '2:15 PM' to minutes past midnight"""
+    clock, meridiem = value.strip().upper().split()
+    hours, minutes = (int(part) for part in clock.split(":"))
+    hours = hours % 12 + (12 if meridiem == "PM" else 0)
+    return hours * 60 + minutes
+
+def parse_slot(day_label, time_label, session="lecture"):
+    """Build a TimeSlot from report labels such as 'Monday / Wednesday' and '9:00 AM - 10:30 AM'"""
+    start, end = (parse_time(part) for part in str(time_label).split(" - "))
+    days = tuple(day.strip() for day in str(day_label).split("/"))
+    return TimeSlot(days, start, end, session, str(day_label).strip(), str(time_label).strip())
+
+@lru_cache(maxsize=None)
+def load_time_grid(path=TIME_GRID_FILE):
+    """Read the time grid table into {program_type: tuple of TimeSlot} in file order"""
+    grid = defaultdict(list)
+
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            start, end = parse_time(row["start"]), parse_time(row["end"])
+            if start % GRID_MINUTES or end % GRID_MINUTES or end <= start:
+                raise ValueError(
+                    f"Invalid slot {row['days']} {row['start']} - {row['end']} in {path}: "
+                    f"times must be increasing and on a {GRID_MINUTES}-minute grid"
+                )
+
+            days = tuple(day.strip() for day in row["days"].split("/"))
+            grid[row["program_type"].strip()].append(TimeSlot(
+                days, start, end,
+                row["session"].strip().lower(),
+                row["days"].strip(),
+                f"{row['start'].strip()} - {row['end'].strip()}"
+            ))
+
+    return {program_type: tuple(slots) for program_type, slots in grid.items()}
+
+@lru_cache(maxsize=None)
+def load_program_types(path=PROGRAM_TYPES_FILE):
+    """Read (program_type, compiled pattern, weekend_optional) rules; first match wins"""
+    with open(path, newline="", encoding="utf-8") as f:
+        return tuple(
+            (
+                row["program_type"].strip(),
+                re.compile(row["pattern"], re.IGNORECASE),
+                row["weekend_optional"].strip().lower() == "true"
+            )
+            for row in csv.DictReader(f)
+        )
+
+def program_type_for(program_name):
+    """Return (program_type, weekend_optional) for a program name"""
+    for program_type, pattern, weekend_optional in load_program_types():
+        if pattern.search(str(program_name)):
+            return program_type, weekend_optional
+    return "undergraduate", True
+
+def build_slot_grid(program_name, allow_weekend_courses=True):
+    """Return the TimeSlots available to a program as a tuple"""
+    program_type, weekend_optional = program_type_for(program_name)
+    slots = load_time_grid()[program_type]
+
+    if weekend_optional and not allow_weekend_courses:
+        slots = tuple(slot for slot in slots if not slot.is_weekend)
+
+    return slots
+
+class IntervalIndex:
+    """Busy time per day kept as sorted, merged [start, end) intervals
+
+    Overlap checks are a bisect per day, so slots of different lengths
+    (lectures, labs, evening blocks) can be compared in O(log n).
+    """
+
+    def __init__(self):
+        self.starts = defaultdict(list)
+        self.ends = defaultdict(list)
+
+    def overlaps(self, slot):
+        for day in slot.days:
+            starts, ends = self.starts[day], self.ends[day]
+            i = bisect_left(starts, slot.end)
+            if i and ends[i - 1] > slot.start:
+                return True
+        return False
+
+    def add(self, slot):
+        for day in slot.days:
+            starts, ends = self.starts[day], self.ends[day]
+            lo = bisect_left(ends, slot.start)
+            hi = bisect_right(starts, slot.end)
+            start, end = slot.start, slot.end
+            if lo < hi:
+                start = min(start, starts[lo])
+                end = max(end, ends[hi - 1])
+            starts[lo:hi] = [start]
+            ends[lo:hi] = [end]
+
+def is_lab_course(course):
+    """Lab sections are detected from the course title"""
+    return bool(LAB_PATTERN.search(str(course)))
+
+def split_slot_grid(slot_grid):
+    """Return (lab_slots, lecture_slots) for a slot grid"""
+    lab_slots = [slot for slot in slot_grid if slot.session == "lab"]
+    lecture_slots = [slot for slot in slot_grid if slot.session != "lab"]
+    return lab_slots, lecture_slots
+
+def eligible_slots_for(course, lab_slots, lecture_slots):
+    """Lab courses use lab slots when the grid has any; everything else uses lecture slots"""
+    return lab_slots if lab_slots and is_lab_course(course) else lecture_slots
+
+def place_sections(courses, sections, slot_grid, rng, conflicts=None, reserved=None, fallbacks=None,
+                   external=None):
+    """Greedy placement of every course section; `rng` only drives the fallback choice
+
+    `conflicts` optionally lists, per course position, the positions of other
+    courses that share students. Sections avoid overlapping any section of
+    those courses when the grid allows it. `external` likewise lists, per
+    position, the TimeSlots of co-enrolled courses already placed for other
+    programs. `reserved` holds (section, TimeSlot) pairs already taken by
+    classes scheduled elsewhere, e.g. pooled courses.
+    A (position, section) pair is appended to the `fallbacks` list for every
+    section that had no free slot and was placed at random.
+    """
+    section_busy = defaultdict(IntervalIndex)
+    for sec, slot in reserved or ():
+        section_busy[sec].add(slot)
+    course_section_slots = defaultdict(set)
+    course_busy = defaultdict(IntervalIndex)
+    external_busy = defaultdict(IntervalIndex)
+    for position, slots in enumerate(external or ()):
+        for slot in slots:
+            external_busy[position].add(slot)
+
+    lab_slots, lecture_slots = split_slot_grid(slot_grid)
+    schedule = []
+
+    for position, (course, required_sections) in enumerate(zip(courses, sections)):
+        eligible_slots = eligible_slots_for(course, lab_slots, lecture_slots)
+        used_slots = course_section_slots[course]
+        shared = [course_busy[other] for other in conflicts[position]] if conflicts else []
+        if position in external_busy:
+            shared.append(external_busy[position])
+
+        for sec in range(1, required_sections + 1):
+            busy = section_busy[sec]
+            chosen = None
+
+            for respect_shared in ([True, False] if shared else [False]):
+                for slot in eligible_slots:
+                    if slot in used_slots or busy.overlaps(slot):
+                        continue
+                    if respect_shared and any(other.overlaps(slot) for other in shared):
+                        continue
+                    chosen = slot
+                    break
+                if chosen is not None:
+                    break
+
+            if chosen is None:
+                chosen = rng.choice(eligible_slots)
+                if fallbacks is not None:
+                    fallbacks.append((position, sec))
+
+            busy.add(chosen)
+            used_slots.add(chosen)
+            course_busy[position].add(chosen)
+            schedule.append((sec, chosen.day_label, chosen.time_label))
+
+    return schedule
+
+def place_pooled_sections(courses, members, slot_grid, rng, fallbacks=None):
+    """Greedy placement of pooled sections shared by several program sections
+
+    `members[position]` lists, per pooled section of that course, the
+    (program, section) keys attending it; a slot is taken only when it is
+    free for all of them. Returns one (section, days, time) entry per pooled
+    section, in the same order as place_sections(). Random placements are
+    recorded in `fallbacks` as for place_sections().
+    """
+    member_busy = defaultdict(IntervalIndex)
+    lab_slots, lecture_slots = split_slot_grid(slot_grid)
+    schedule = []
+
+    for position, (course, course_members) in enumerate(zip(courses, members)):
+        eligible_slots = eligible_slots_for(course, lab_slots, lecture_slots)
+        used_slots = set()
+
+        for sec, keys in enumerate(course_members, start=1):
+            busy = [member_busy[key] for key in keys]
+            free_slots = [slot for slot in eligible_slots if not any(index.overlaps(slot) for index in busy)]
+            # Spread sections over unused slots first; pooled sections may share a time in different rooms
+            chosen = next((slot for slot in free_slots if slot not in used_slots), None)
+            if chosen is None and free_slots:
+                chosen = free_slots[0]
+            if chosen is None:
+                chosen = rng.choice(eligible_slots)
+                if fallbacks is not None:
+                    fallbacks.append((position, sec))
+
+            for index in busy:
+                index.add(chosen)
+            used_slots.add(chosen)
+            schedule.append((sec, chosen.day_label, chosen.time_label))
+
+    return schedule
+
+@lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def schedule_courses(courses, sections, slot_grid, allow_weekend_courses=True, seed=0, conflicts=None, reserved=None,
+                     external=None):
+    """Pure, memoized (schedule, fallbacks) for hashable inputs; the same arguments always give the same pair
+
+    `fallbacks` holds the (position, section) pairs place_sections() placed
+    at random. `allow_weekend_courses` is part of the cache key so callers
+    that pass a prebuilt grid still get separate entries per weekend policy.
+    """
+    fallbacks = []
+    schedule = place_sections(
+        courses, sections, slot_grid, random.Random(seed), conflicts, reserved, fallbacks, external
+    )
+    return tuple(schedule), tuple(fallbacks)
+
+def course_conflicts(course_codes, conflict_edges):
+    """Per course position, the positions of courses it shares students with
+
+    `conflict_edges` maps a course code to the codes it is co-enrolled with.
+    Returns None when no course in the list has an edge.
+    """
+    codes = [str(code).strip() for code in course_codes]
+    conflicts = tuple(
+        tuple(j for j, other in enumerate(codes) if j != i and other in conflict_edges.get(code, ()))
+        for i, code in enumerate(codes)
+    )
+    return conflicts if any(conflicts) else None
+
+def external_conflicts(course_codes, conflict_edges, placed_courses):
+    """Per course position, the sorted TimeSlots of co-enrolled courses placed elsewhere
+
+    `placed_courses` maps a course code to the set of TimeSlots its sections
+    already occupy in other programs' timetables. Returns None when no course
+    in the list has a co-enrolled course placed yet.
+    """
+    codes = [str(code).strip() for code in course_codes]
+    external = tuple(
+        tuple(sorted({
+            slot for other in conflict_edges.get(code, ()) if other != code
+            for slot in placed_courses.get(other, ())
+        }))
+        for code in codes
+    )
+    return external if any(external) else None
+
+def record_placements(placed_courses, course_codes, schedule):
+    """Add the TimeSlots of (section, days, time) schedule entries to `placed_courses` by course code"""
+    for code, (_, days, times) in zip(course_codes, schedule):
+        placed_courses.setdefault(str(code).strip(), set()).add(parse_slot(days, times))
+
+def assign_schedule(df, allow_weekend_courses=True, seed=0, rng=None, conflict_edges=None, reserved=None,
+                    fallbacks=None, placed_courses=None):
+    """Improved scheduling function
+
+    Results are deterministic for a given `seed` and shared through the
+    schedule_courses() memo. Passing an explicit `rng` bypasses the memo.
+    `conflict_edges` ({course_code: co-enrolled codes}) adds student-level
+    conflicts between courses on top of the per-section rule. `reserved`
+    (section, TimeSlot) pairs are kept free for classes scheduled elsewhere.
+    `placed_courses` ({course_code: TimeSlots}) holds courses already placed
+    for other programs, so co-enrolled courses are kept apart across
+    programs too. Passing a `fallbacks` list collects random placements (see
+    place_sections()).
+    """
+    program_name = df["program"].iloc[0] if not df.empty else ""
+
+    courses = tuple(df["course_title"])
+    sections = tuple(int(s) for s in df["required sections"])
+    slot_grid = build_slot_grid(program_name, allow_weekend_courses)
+    conflicts = course_conflicts(df["course_code"], conflict_edges) if conflict_edges else None
+    reserved = tuple(sorted(set(reserved))) if reserved else None
+    external = (
+        external_conflicts(df["course_code"], conflict_edges, placed_courses)
+        if conflict_edges and placed_courses else None
+    )
+
+    if rng is not None:
+        return place_sections(courses, sections, slot_grid, rng, conflicts, reserved, fallbacks, external)
+
+    schedule, positions = schedule_courses(
+        courses, sections, slot_grid, allow_weekend_courses, seed, conflicts, reserved, external
+    )
+    if fallbacks is not None:
+        fallbacks.extend(positions)
+    return list(schedule)
@@ -0,0 +1,185 @@
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+
+import pandas as pd
+
+# Local SQLite file holding ingested catalogs and every generated report
+DB_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ssk_acms.db")
+
+CATALOG_COLUMNS = ['program', 'college', 'semester', 'course_code', 'course_title', 'term']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalog_files (
+    catalog_year TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS catalog_courses (
+    catalog_year TEXT NOT NULL,
+    row_order INTEGER NOT NULL,
+    program TEXT,
+    college TEXT,
+    semester TEXT,
+    course_code TEXT,
+    course_title TEXT,
+    term TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_catalog_year_program_semester
+    ON catalog_courses (catalog_year, program, semester);
+CREATE INDEX IF NOT EXISTS idx_catalog_course_code ON catalog_courses (course_code);
+
+CREATE TABLE IF NOT EXISTS reports (
+    report_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    catalog_year TEXT,
+    program_filter TEXT,
+    semester TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS schedule_rows (
+    row_id INTEGER PRIMARY KEY,
+    report_id INTEGER NOT NULL REFERENCES reports (report_id),
+    catalog_year TEXT,
+    program TEXT,
+    college TEXT,
+    semester TEXT,
+    section INTEGER,
+    course_code TEXT,
+    course_title TEXT,
+    days TEXT,
+    time_slot TEXT,
+    total_students INTEGER,
+    required_sections INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_schedule_year_program_semester
+    ON schedule_rows (catalog_year, program, semester);
+CREATE INDEX IF NOT EXISTS idx_schedule_course_code ON schedule_rows (course_code);
+
+-- One row per meeting day, so 'Tuesday / Thursday' sections show up under Tuesday
+CREATE TABLE IF NOT EXISTS schedule_meetings (
+    row_id INTEGER NOT NULL REFERENCES schedule_rows (row_id),
+    day TEXT NOT NULL,
+    time_slot TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_meetings_day_time ON schedule_meetings (day, time_slot);
+"""
+
+def file_version(filename):
+    """Catalog version used for invalidation: modification time and size of the file"""
+    stat = os.stat(filename)
+    return stat.st_mtime_ns, stat.st_size
+
+_initialized = set()
+
+def connect(db_file=DB_FILE):
+    """Open the store, creating tables and indexes on first use"""
+    conn = sqlite3.connect(db_file)
+    if db_file not in _initialized:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        _initialized.add(db_file)
+    return conn
+
+def sync_catalog(catalog_year, filename, version, read_catalog, db_file=DB_FILE):
+    """Ingest a catalog file unless the stored copy already has this (mtime_ns, size) version"""
+    with closing(connect(db_file)) as conn, conn:
+        stored = conn.execute(
+            "SELECT mtime_ns, size FROM catalog_files WHERE catalog_year = ? AND filename = ?",
+            (catalog_year, filename)
+        ).fetchone()
+        if stored == tuple(version):
+            return False
+
+        catalog_df = read_catalog(filename)
+        catalog_df = catalog_df.loc[:, ~catalog_df.columns.duplicated()].reindex(columns=CATALOG_COLUMNS)
+        catalog_df['course_code'] = catalog_df['course_code'].astype(str).str.strip()
+        catalog_df = catalog_df.astype(object).where(catalog_df.notna(), None)
+        rows = [
+            (catalog_year, i, *values)
+            for i, values in enumerate(catalog_df.itertuples(index=False, name=None))
+        ]
+
+        conn.execute("DELETE FROM catalog_courses WHERE catalog_year = ?", (catalog_year,))
+        conn.executemany(
+            "INSERT INTO catalog_courses (catalog_year, row_order, program, college, semester, "
+            "course_code, course_title, term) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO catalog_files (catalog_year, filename, mtime_ns, size) VALUES (?, ?, ?, ?)",
+            (catalog_year, filename, *version)
+        )
+    return True
+
+def ingest_catalogs(catalog_files, read_catalog, db_file=DB_FILE, version=file_version):
+    """Sync every {catalog_year: filename} entry; returns the years that were (re)ingested"""
+    return [
+        catalog_year
+        for catalog_year, filename in catalog_files.items()
+        if os.path.exists(filename)
+        and sync_catalog(catalog_year, filename, version(filename), read_catalog, db_file)
+    ]
+
+def load_catalog(catalog_year, db_file=DB_FILE):
+    """Catalog rows for one academic year in their original file order"""
+    with closing(connect(db_file)) as conn:
+        return pd.read_sql_query(
+            "SELECT program, college, semester, course_code, course_title, term FROM catalog_courses "
+            "WHERE catalog_year = ? ORDER BY row_order",
+            conn, params=(catalog_year,)
+        )
+
+def save_report(final_df, program_filter, semester, catalog_year, db_file=DB_FILE):
+    """Store a generated timetable and return its report_id"""
+    with closing(connect(db_file)) as conn, conn:
+        report_id = conn.execute(
+            "INSERT INTO reports (catalog_year, program_filter, semester, created_at) VALUES (?, ?, ?, ?)",
+            (catalog_year, program_filter, semester, datetime.now().isoformat(timespec="seconds"))
+        ).lastrowid
+
+        first_row_id = (conn.execute("SELECT COALESCE(MAX(row_id), 0) FROM schedule_rows").fetchone()[0]) + 1
+        rows, meetings = [], []
+        columns = final_df[[
+            "program", "college", "semester_selected", "section", "course_code", "course_title",
+            "days", "time's", "total student strength", "required sections"
+        ]]
+        for row_id, values in enumerate(columns.itertuples(index=False, name=None), start=first_row_id):
+            program, college, sem, section, code, title, days, time_slot, students, sections = values
+            rows.append((
+                row_id, report_id, catalog_year, program, college, sem, int(section), str(code).strip(), title,
+                days, time_slot, int(students), int(sections)
+            ))
+            meetings.extend((row_id, day.strip(), time_slot) for day in str(days).split("/"))
+
+        conn.executemany(
+            "INSERT INTO schedule_rows (row_id, report_id, catalog_year, program, college, semester, section, "
+            "course_code, course_title, days, time_slot, total_students, required_sections) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        conn.executemany("INSERT INTO schedule_meetings (row_id, day, time_slot) VALUES (?, ?, ?)", meetings)
+    return report_id
+
+def course_sections(course_code, db_file=DB_FILE):
+    """Every stored section of a course across catalog years and reports"""
+    with closing(connect(db_file)) as conn:
+        return pd.read_sql_query(
+            "SELECT catalog_year, program, semester, section, course_title, days, time_slot, report_id "
+            "FROM schedule_rows WHERE course_code = ? ORDER BY catalog_year, program, section",
+            conn, params=(course_code.strip(),)
+        )
+
+def slot_load(day, time_prefix, db_file=DB_FILE):
+    """Sections meeting on `day` in slots starting with `time_prefix` (e.g. 'Tuesday', '9:00'), per report"""
+    with closing(connect(db_file)) as conn:
+        return pd.read_sql_query(
+            "SELECT r.report_id, r.catalog_year, r.semester, m.time_slot, COUNT(*) AS sections "
+            "FROM schedule_meetings m "
+            "JOIN schedule_rows s ON s.row_id = m.row_id "
+            "JOIN reports r ON r.report_id = s.report_id "
+            "WHERE m.day = ? AND m.time_slot >= ? AND m.time_slot < ? "
+            "GROUP BY r.report_id, m.time_slot ORDER BY r.report_id",
+            conn, params=(day, time_prefix, time_prefix + "\uffff")
+        )
@@ -0,0 +1,160 @@
+import base64
+
+import streamlit as st
+
+@st.cache_data(show_spinner=False)
+def get_base64_of_bin_file(bin_file):
+    """Convert image to base64 string"""
+    try:
+        with open(bin_file, 'rb') as f:
+            data = f.read()
+        return base64.b64encode(data).decode()
+    except:
+        return None
+
+def set_background_image():
+    """Set background image for the app"""
+    bin_str = get_base64_of_bin_file('bg.jpg')
+    
+    if bin_str:
+        background_css = f"""
+        <style>
+        .stApp {{
+            background-image: url("data:image/jpg;base64,{bin_str}");
+            background-size: cover;
+            background-position: center;
+            background-repeat: no-repeat;
+            background-attachment: fixed;
+        }}
+        
+        .stApp > div:first-child {{
+            background: rgba(255, 255, 255, 0.1);
+            backdrop-filter: blur(10px);
+            -webkit-backdrop-filter: blur(10px);
+        }}
+        
+        .main .block-container {{
+            background: rgba(255, 255, 255, 0.9);
+            border-radius: 10px;
+            padding: 2rem;
+            margin-top: 1rem;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        }}
+        
+        /* Force all text in main content to be white with shadow */
+        .main .block-container * {{
+            color: white !important;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.8) !important;
+        }}
+        
+        /* But keep dataframes and inputs readable */
+        .main .block-container .stDataFrame,
+        .main .block-container .stDataFrame *,
+        .main .block-container input,
+        .main .block-container .stTextInput,
+        .main .block-container .stSelectbox {{
+            color: #1a1a1a !important;
+            text-shadow: none !important;
+        }}
+        
+        section[data-testid="stSidebar"], section[data-testid="stSidebar"] > div {{
+            background-color: rgba(30, 30, 30, 0.95) !important;
+            backdrop-filter: blur(10px);
+            -webkit-backdrop-filter: blur(10px);
+            border-right: 2px solid rgba(255, 255, 255, 0.2) !important;
+        }}
+        
+        section[data-testid="stSidebar"] .stMarkdown h1,
+        section[data-testid="stSidebar"] .stMarkdown h2,
+        section[data-testid="stSidebar"] .stMarkdown h3,
+        section[data-testid="stSidebar"] .stMarkdown h4,
+        section[data-testid="stSidebar"] .stMarkdown p,
+        section[data-testid="stSidebar"] label {{
+            color: white !important;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.8) !important;
+            font-weight: bold !important;
+        }}
+        
+        section[data-testid="stSidebar"] .stSelectbox > div > div > div,
+        section[data-testid="stSidebar"] .stNumberInput > div > div > input,
+        section[data-testid="stSidebar"] .stTextInput > div > div > input {{
+            background-color: rgba(60, 60, 60, 0.9) !important;
+            color: white !important;
+            border: 1px solid rgba(255, 255, 255, 0.3) !important;
+            border-radius: 5px !important;
+        }}
+        
+        section[data-testid="stSidebar"] .stButton > button {{
+            background: linear-gradient(45deg, #FF6B6B, #4ECDC4) !important;
+            color: white !important;
+            border: none !important;
+            border-radius: 8px !important;
+            font-weight: bold !important;
+        }}
+        
+        .stMarkdown h1, .stMarkdown h2, .stMarkdown h3, .stMarkdown h4, .stMarkdown h5, .stMarkdown h6,
+        h1, h2, h3, h4, h5, h6, p {{
+            color: white !important;
+            text-shadow: 3px 3px 6px rgba(0,0,0,0.8) !important;
+        }}
+        </style>
+        """
+    else:
+        background_css = """
+        <style>
+        .stApp {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            background-attachment: fixed;
+        }
+        
+        .main .block-container {
+            background: rgba(255, 255, 255, 0.95);
+            border-radius: 10px;
+            padding: 2rem;
+            margin-top: 1rem;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        }
+        
+        section[data-testid="stSidebar"], section[data-testid="stSidebar"] > div {
+            background-color: rgba(30, 30, 30, 0.95) !important;
+            backdrop-filter: blur(10px);
+            border-right: 2px solid rgba(255, 255, 255, 0.2) !important;
+        }
+        
+        section[data-testid="stSidebar"] .stMarkdown h1,
+        section[data-testid="stSidebar"] .stMarkdown h2,
+        section[data-testid="stSidebar"] .stMarkdown h3,
+        section[data-testid="stSidebar"] .stMarkdown h4,
+        section[data-testid="stSidebar"] .stMarkdown p,
+        section[data-testid="stSidebar"] label {
+            color: white !important;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.8) !important;
+            font-weight: bold !important;
+        }
+        
+        section[data-testid="stSidebar"] .stSelectbox > div > div > div,
+        section[data-testid="stSidebar"] .stNumberInput > div > div > input,
+        section[data-testid="stSidebar"] .stTextInput > div > div > input {
+            background-color: rgba(60, 60, 60, 0.9) !important;
+            color: white !important;
+            border: 1px solid rgba(255, 255, 255, 0.3) !important;
+            border-radius: 5px !important;
+        }
+        
+        section[data-testid="stSidebar"] .stButton > button {
+            background: linear-gradient(45deg, #FF6B6B, #4ECDC4) !important;
+            color: white !important;
+            border: none !important;
+            border-radius: 8px !important;
+            font-weight: bold !important;
+        }
+        
+        .stMarkdown h1, .stMarkdown h2, .stMarkdown h3, .stMarkdown h4, .stMarkdown h5, .stMarkdown h6,
+        h1, h2, h3, h4, h5, h6, p {
+            color: white !important;
+            text-shadow: 3px 3px 6px rgba(0,0,0,0.8) !important;
+        }
+        </style>
+        """
+    
+    st.markdown(background_css, unsafe_allow_html=True)